@@ -0,0 +1,70 @@
+import argparse
+import json
+import os
+import sys
+
+from src.benchmark import SCENES, compare, run_benchmarks
+from src.constants import BENCHMARK_CONSTANTS
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark generated scenes without a window and compare "
+        "the results with a baseline."
+    )
+    parser.add_argument(
+        "--scenes", nargs="+", choices=list(SCENES), default=None,
+        help="scenes to run, all by default"
+    )
+    parser.add_argument(
+        "--backend", default=None, help="glcontext backend, e.g. egl"
+    )
+    parser.add_argument(
+        "-o", "--output", default=None, help="write the results to this file"
+    )
+    parser.add_argument(
+        "--baseline", default=BENCHMARK_CONSTANTS.BASELINE_FILE_NAME,
+        help="baseline results to compare with"
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=BENCHMARK_CONSTANTS.TOLERANCE,
+        help="accepted relative slowdown, e.g. 0.3 for 30%%"
+    )
+    parser.add_argument(
+        "--update-baseline", action="store_true",
+        help="store the results as the new baseline instead of comparing"
+    )
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.scenes, args.backend)
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"stored baseline in {args.baseline}")
+        sys.exit(0)
+
+    if not os.path.exists(args.baseline):
+        print(json.dumps(results["scenes"], indent=2))
+        print(f"no baseline at {args.baseline}, run with --update-baseline")
+        sys.exit(0)
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline["machine"] != results["machine"]:
+        print(
+            f"warning: baseline measured on {baseline['machine']}, "
+            f"comparing on {results['machine']}"
+        )
+
+    lines, regressions = compare(results, baseline, args.tolerance)
+    print(f"{'scene':<16}{'metric':<12}{'baseline':>10}{'current':>10}"
+          f"{'change':>9}")
+    print("\n".join(lines))
+    if regressions:
+        print(f"\n{len(regressions)} PERFORMANCE REGRESSION(S):")
+        print("\n".join(regressions))
+        sys.exit(1)
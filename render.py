@@ -0,0 +1,55 @@
+import argparse
+
+from src.constants import GUI_ANIMATION_WIDGET_CONSTANTS, HEADLESS_CONSTANTS
+from src.headless_engine import HeadlessEngine
+from src.sharded_export import render_sharded
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Render a saved scene to a video file without a window."
+    )
+    parser.add_argument("scene", help="path to the scene file")
+    parser.add_argument(
+        "-o", "--output",
+        default=GUI_ANIMATION_WIDGET_CONSTANTS.OUTPUT_FILE_NAME,
+        help="output file name, without extension"
+    )
+    parser.add_argument("--width", type=int, default=HEADLESS_CONSTANTS.WIDTH)
+    parser.add_argument(
+        "--height", type=int, default=HEADLESS_CONSTANTS.HEIGHT
+    )
+    parser.add_argument(
+        "--fps", type=float, default=GUI_ANIMATION_WIDGET_CONSTANTS.OUTPUT_FPS
+    )
+    parser.add_argument(
+        "--backend", default=None, help="glcontext backend, e.g. egl"
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=1,
+        help="render frame ranges in this many processes, 0 for all cores"
+    )
+    parser.add_argument(
+        "--profile", default=None, metavar="PATH",
+        help="profile every frame and dump the samples to a .json or .csv"
+    )
+    args = parser.parse_args()
+
+    if args.workers != 1:
+        count = render_sharded(
+            args.scene, args.workers or None, args.output, args.fps,
+            (args.width, args.height), args.backend
+        )
+        print(f"rendered {count} frames")
+    else:
+        engine = HeadlessEngine((args.width, args.height), args.backend)
+        engine.profiler.enabled = args.profile is not None
+        key_frames, frames = engine.load_scene(args.scene)
+        encoder = engine.render_animation(
+            key_frames, frames, args.output, args.fps
+        )
+        print(encoder.report())
+        print(engine.culler.report())
+        engine.destroy()
+        if args.profile is not None:
+            print(engine.profiler.report())
+            engine.profiler.dump(args.profile)
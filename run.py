@@ -1,10 +1,86 @@
-import sys
-from PyQt5.QtWidgets import QApplication
+import time
 
-from src import MainWindow
+START = time.perf_counter()
+
+import argparse  # noqa: E402
+import sys  # noqa: E402
+
+from src import startup_trace  # noqa: E402
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    window = MainWindow()
-    window.show()
+    parser = argparse.ArgumentParser(description="Run the graphics engine.")
+    parser.add_argument(
+        "--trace-startup", action="store_true",
+        help="print the import and init time of every subsystem once the "
+        "first frame is shown"
+    )
+    parser.add_argument(
+        "--startup-budget", type=float, nargs="?", const=-1.0, default=None,
+        metavar="SECONDS",
+        help="trace the startup, quit after the first frame and fail if it "
+        "took longer than the budget or imported a deferred module"
+    )
+    args, qt_args = parser.parse_known_args()
+    if args.trace_startup or args.startup_budget is not None:
+        startup_trace.start(START)
+
+    with startup_trace.span("import src.constants"):
+        from src.constants import STARTUP_CONSTANTS
+    startup_trace.import_modules(STARTUP_CONSTANTS.MODULES)
+
+    from PyQt5.QtCore import QTimer
+    from PyQt5.QtWidgets import QApplication
+    from src import MainWindow
+
+    budget = args.startup_budget
+    if budget is not None and budget < 0:
+        budget = STARTUP_CONSTANTS.BUDGET_S
+
+    with startup_trace.span("QApplication"):
+        app = QApplication(sys.argv[:1] + qt_args)
+    with startup_trace.span("MainWindow"):
+        window = MainWindow()
+
+    def on_budget_exceeded() -> None:
+        window.ge_widget.rendered.disconnect(on_first_frame)
+        startup_trace.mark("budget exceeded")
+        print(startup_trace.report(STARTUP_CONSTANTS.DEFERRED_MODULES))
+        print(
+            f"STARTUP BUDGET EXCEEDED: no frame within {budget:.2f} s"
+        )
+        app.exit(1)
+
+    def on_first_frame() -> None:
+        window.ge_widget.rendered.disconnect(on_first_frame)
+        watchdog.stop()
+        startup_trace.mark("first frame")
+        print(startup_trace.report(STARTUP_CONSTANTS.DEFERRED_MODULES))
+        if budget is None:
+            return
+
+        errors = []
+        if startup_trace.elapsed() > budget:
+            errors.append(
+                f"first frame after {startup_trace.elapsed():.2f} s, "
+                f"budget is {budget:.2f} s"
+            )
+        errors.extend(
+            f"{name} was imported at startup"
+            for name in STARTUP_CONSTANTS.DEFERRED_MODULES
+            if name in sys.modules
+        )
+        for error in errors:
+            print(f"STARTUP BUDGET EXCEEDED: {error}")
+        app.exit(1 if errors else 0)
+
+    # Fails the budget check even if the first frame never arrives.
+    watchdog = QTimer()
+    watchdog.setSingleShot(True)
+    watchdog.timeout.connect(on_budget_exceeded)
+    if startup_trace.is_enabled():
+        window.ge_widget.rendered.connect(on_first_frame)
+    if budget is not None:
+        watchdog.start(max(0, int((budget - startup_trace.elapsed()) * 1000)))
+    with startup_trace.span("show"):
+        window.show()
     sys.exit(app.exec_())
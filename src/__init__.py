@@ -1,8 +1,47 @@
 # flake8: noqa
-from . import constants
-from .camera import Camera
-from .graphics_engine import GraphicsEngine
-from .window.gui import GUI
-from .objects import Cube, OpenGLObject
-from .window.main_window import MainWindow
-from .window.add_block_window import AddBlockWindow
\ No newline at end of file
+"""
+The exports are imported on first access, so importing a single submodule
+does not pull in Qt, OpenGL and every other subsystem.
+"""
+import importlib
+
+_EXPORTS = {
+    "constants": ".constants",
+    "Camera": ".camera",
+    "GraphicsEngine": ".graphics_engine",
+    "GUI": ".window.gui",
+    "Cube": ".objects",
+    "OpenGLObject": ".objects",
+    "MainWindow": ".window.main_window",
+    "AddBlockWindow": ".window.add_block_window",
+}
+
+
+def __getattr__(name: str):
+    """
+    Imports an export of the package on first access.
+
+    Args:
+        name (str): The name of the export.
+
+    Returns:
+        The exported module or class.
+
+    Raises:
+        AttributeError: If the package has no such export.
+    """
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_EXPORTS[name], __name__)
+    return module if name == "constants" else getattr(module, name)
+
+
+def __dir__() -> list[str]:
+    """
+    Lists the attributes of the package, including the exports that are
+    not imported yet.
+
+    Returns:
+        list[str]: The names of the attributes.
+    """
+    return sorted(set(globals()) | set(_EXPORTS))
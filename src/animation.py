@@ -0,0 +1,143 @@
+"""
+This file contains the key frame interpolation used by the animation widget
+and the headless renderer.
+
+The key frames of every animated object are stored in one KeyFrameTimeline
+as sorted NumPy arrays of frames and values, so the pose of all objects at
+any number of frames is found with a single `np.searchsorted` call and a
+vectorized linear interpolation. Before the first and after the last key
+frame of an object its nearest key frame is held.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.objects.opengl_object import OpenGLObject
+
+import numpy as np
+
+from src.scene import Scene
+
+
+class KeyFrameTimeline:
+    """
+    Class for the precomputed key frames of all animated objects.
+
+    A pose is an array with one row per animated object, in the order of
+    `names`, holding position, rotation in radians and scale.
+    """
+
+    COMPONENTS = 9
+
+    def __init__(self, key_frames: dict[str, dict[int, tuple]]) -> None:
+        self._names = [name for name, frames in key_frames.items() if frames]
+
+        frames, values, counts = [], [], []
+        for name in self._names:
+            for frame, (pos, rot, scale) in sorted(key_frames[name].items()):
+                frames.append(frame)
+                values.append([*pos, *rot, *scale])
+            counts.append(len(key_frames[name]))
+
+        self._frames = np.array(frames, dtype=np.float64)
+        self._values = np.array(values, dtype=np.float64).reshape(
+            -1, self.COMPONENTS
+        )
+        self._ends = np.cumsum(counts, dtype=np.int64)
+        self._starts = self._ends - np.array(counts, dtype=np.int64)
+
+        # The frames of each object are shifted past those of the previous
+        # one, so all of them form one sorted array that can be searched at
+        # once. Queries are clamped to the key frame range before shifting.
+        if len(self._frames):
+            self._first = self._frames.min()
+            self._last = self._frames.max()
+        else:
+            self._first = self._last = 0.0
+        self._span = self._last - self._first + 1
+        self._offsets = np.arange(len(self._names)) * self._span
+        self._keys = self._frames - self._first + np.repeat(
+            self._offsets, counts
+        )
+
+    # ====== PROPERTIES ====== #
+
+    @property
+    def names(self) -> list[str]:
+        """
+        [READ-ONLY] list[str]: The names of the animated objects, in the
+        order of the rows of a pose.
+        """
+        return self._names
+
+    # ====== PUBLIC METHODS ====== #
+
+    def evaluate(self, frames) -> np.ndarray:
+        """
+        Evaluates the pose of every animated object at every given frame.
+
+        :param frames: The frames, a scalar or any array-like of numbers.
+
+        Returns:
+            np.ndarray: The poses, of shape (frames, objects, 9).
+        """
+        frames = np.atleast_1d(np.asarray(frames, dtype=np.float64))
+        clamped = np.clip(frames, self._first, self._last) - self._first
+        queries = clamped[:, None] + self._offsets[None, :]
+
+        after = np.searchsorted(self._keys, queries, side="right")
+        starts, ends = self._starts[None, :], self._ends[None, :] - 1
+        upper = np.clip(after, starts, ends)
+        lower = np.clip(after - 1, starts, ends)
+
+        lower_frames = self._keys[lower]
+        gap = self._keys[upper] - lower_frames
+        t = np.divide(
+            queries - lower_frames, gap,
+            out=np.zeros_like(queries), where=gap > 0
+        )
+
+        lower_values = self._values[lower]
+        return lower_values + (
+            self._values[upper] - lower_values
+        ) * t[..., None]
+
+    def apply(
+            self,
+            objects: Scene | dict[str, OpenGLObject],
+            pose: np.ndarray
+            ) -> None:
+        """
+        Moves the objects to a pose.
+
+        :param objects: The scene, or its objects by name.
+        :param pose: The pose, one row per animated object.
+        """
+        for name, values in zip(self._names, pose.tolist()):
+            obj = objects.get(name)
+            if obj is not None:
+                obj.pos = tuple(values[0:3])
+                obj.rot = tuple(values[3:6])
+                obj.scale = tuple(values[6:9])
+
+
+def update_objects(
+        scene: Scene | list[OpenGLObject],
+        key_frames: dict[str, dict[int, tuple]] | KeyFrameTimeline,
+        frame: int
+        ) -> None:
+    """
+    Updates the objects of the scene to the given frame.
+
+    :param scene: The objects to update.
+    :param key_frames: The key frames of the objects, by object name, or
+        their precomputed timeline.
+    :param frame: The frame to update to.
+    """
+    timeline = key_frames
+    if not isinstance(timeline, KeyFrameTimeline):
+        timeline = KeyFrameTimeline(key_frames)
+    objects = scene
+    if not isinstance(objects, Scene):
+        objects = {obj._name: obj for obj in scene}
+    timeline.apply(objects, timeline.evaluate(frame)[0])
@@ -0,0 +1,228 @@
+"""
+This file contains the AssetLoader class.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.graphics_engine import GraphicsEngine
+    from src.objects.opengl_object import OpenGLObject
+
+import logging
+import os
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+from src.constants import OPENGL_CONSTANTS
+from src.objects.cube import Cube
+from src.texture_cache import TextureCache
+
+
+class AssetLoader:
+    """
+    Class for loading the assets of objects in the background.
+
+    Decoding textures and parsing and simplifying meshes runs on a thread
+    pool, one task per texture and per mesh however many objects use them.
+    Uploading to the GPU needs the GL context, so it happens in `poll`,
+    called from the render thread. Until its assets are uploaded an object
+    is drawn as a placeholder cube with its transform.
+    """
+
+    def __init__(
+        self,
+        app: GraphicsEngine,
+        workers: int = OPENGL_CONSTANTS.ASSET_LOADER_WORKERS
+    ) -> None:
+        self._app = app
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="asset-loader"
+        )
+        self._textures = {}
+        self._meshes = {}
+        self._pending = []
+        self._placeholder = None
+
+    # ====== PROPERTIES ====== #
+
+    @property
+    def pending(self) -> int:
+        """
+        [READ-ONLY] Returns the number of objects still loading.
+
+        Returns:
+            int: The number of objects still loading.
+        """
+        return len(self._pending)
+
+    @property
+    def placeholder(self) -> Cube:
+        """
+        [READ-ONLY] Returns the cube drawn in place of loading objects.
+
+        Returns:
+            Cube: The placeholder cube.
+        """
+        if self._placeholder is None:
+            self._placeholder = Cube(
+                self._app,
+                texture_path=OPENGL_CONSTANTS.PLACEHOLDER_TEXTURE,
+                name="placeholder"
+            )
+        return self._placeholder
+
+    # ====== PRIVATE METHODS ====== #
+
+    def _submit_texture(self, texture_path: str) -> Future | None:
+        """
+        Starts decoding the texture unless it is resident or already being
+        decoded.
+
+        Args:
+            texture_path (str): The path to the texture.
+
+        Returns:
+            Future | None: The decoding task, or None if there is nothing to
+            decode.
+        """
+        if texture_path is None or self._app.textures.contains(texture_path):
+            return None
+
+        key = os.path.abspath(texture_path)
+        if key not in self._textures:
+            self._textures[key] = self._executor.submit(
+                TextureCache.decode, texture_path
+            )
+        return self._textures[key]
+
+    def _submit_mesh(self, obj: OpenGLObject) -> Future | None:
+        """
+        Starts loading the geometry of the object unless its mesh is
+        resident or already being loaded.
+
+        Args:
+            obj (OpenGLObject): The object.
+
+        Returns:
+            Future | None: The loading task, or None if there is nothing to
+            load.
+        """
+        key = obj._get_mesh_key()
+        if self._app.meshes.ref_count(("vbo", (key, 0))):
+            return None
+
+        if key not in self._meshes:
+            self._meshes[key] = self._executor.submit(obj._get_lod_data)
+        return self._meshes[key]
+
+    def _finish(
+        self,
+        obj: OpenGLObject,
+        texture_future: Future | None,
+        mesh_future: Future | None
+    ) -> None:
+        """
+        Uploads the loaded assets of the object. Objects that fail to load
+        are logged and removed from the scene.
+
+        Args:
+            obj (OpenGLObject): The object.
+            texture_future (Future | None): The decoding task.
+            mesh_future (Future | None): The loading task.
+        """
+        try:
+            obj._pre_render(
+                image=texture_future.result() if texture_future else None,
+                lod_data=mesh_future.result() if mesh_future else None
+            )
+        except Exception as err:
+            logging.error(f"Could not load {obj._name}: {err}")
+            obj.destroy()
+            self._app.scene.remove(obj)
+
+    # ====== PUBLIC METHODS ====== #
+
+    def load(self, obj: OpenGLObject) -> None:
+        """
+        Starts loading the assets of an object that was created without
+        pre-rendering. The object is drawn as a placeholder until `poll`
+        uploads them.
+
+        Args:
+            obj (OpenGLObject): The object.
+        """
+        obj._loading = True
+        self._pending.append((
+            obj,
+            self._submit_texture(obj._texture_path),
+            self._submit_mesh(obj),
+        ))
+
+    def poll(self) -> None:
+        """
+        Uploads the assets of the objects whose loading has finished. Must be
+        called with the GL context current.
+        """
+        pending = []
+        for entry in self._pending:
+            obj, texture_future, mesh_future = entry
+            if not obj._loading:
+                continue
+            if any(
+                future is not None and not future.done()
+                for future in (texture_future, mesh_future)
+            ):
+                pending.append(entry)
+                continue
+            self._finish(obj, texture_future, mesh_future)
+        self._pending = pending
+
+        in_use = {
+            future for _, *futures in pending for future in futures
+        }
+        self._textures = {
+            key: future for key, future in self._textures.items()
+            if future in in_use
+        }
+        self._meshes = {
+            key: future for key, future in self._meshes.items()
+            if future in in_use
+        }
+
+    def wait(self) -> None:
+        """
+        Blocks until every object is loaded and uploaded. Must be called with
+        the GL context current.
+        """
+        while self._pending:
+            wait([
+                future for _, *futures in self._pending
+                for future in futures if future is not None
+            ])
+            self.poll()
+
+    def render_placeholder(self, obj: OpenGLObject) -> None:
+        """
+        Renders the placeholder with the transform of a loading object.
+
+        Args:
+            obj (OpenGLObject): The loading object.
+        """
+        placeholder = self.placeholder
+        placeholder.pos = obj.pos
+        placeholder.rot = obj.rot
+        placeholder.scale = obj.scale
+        placeholder.render()
+
+    def release(self) -> None:
+        """
+        Cancels the remaining loads and releases the placeholder.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        for obj, *_ in self._pending:
+            obj._loading = False
+        self._pending = []
+        self._textures = {}
+        self._meshes = {}
+        if self._placeholder is not None:
+            self._placeholder.destroy()
+            self._placeholder = None
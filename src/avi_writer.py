@@ -0,0 +1,119 @@
+"""
+This file contains a minimal MJPG AVI muxer, which writes frames that are
+already JPEG encoded without decoding or re-encoding them.
+"""
+import struct
+from fractions import Fraction
+
+from src.constants import GUI_ANIMATION_WIDGET_CONSTANTS
+
+
+AVIF_HASINDEX = 0x10
+AVIIF_KEYFRAME = 0x10
+
+
+class MjpegAviWriter:
+    """
+    Class for writing JPEG frames into an AVI 1.0 container.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        size: tuple[int, int],
+        fps: float = GUI_ANIMATION_WIDGET_CONSTANTS.OUTPUT_FPS
+    ) -> None:
+        self._file = open(path, "wb")
+        self._size = size
+        self._rate = Fraction(fps).limit_denominator(1000)
+        self._index = []
+        self._max_frame_size = 0
+
+        self._write_headers()
+
+    # ====== PRIVATE METHODS ====== #
+
+    def _write_headers(self) -> None:
+        """
+        Writes the RIFF, header and movi lists. The sizes and frame counts
+        are placeholders until `release` patches them.
+        """
+        width, height = self._size
+        f = self._file
+
+        f.write(b"RIFF" + struct.pack("<I", 0) + b"AVI ")
+
+        f.write(b"LIST" + struct.pack("<I", 4 + 64 + 12 + 64 + 48) + b"hdrl")
+        f.write(b"avih" + struct.pack("<I", 56))
+        self._avih_offset = f.tell()
+        f.write(struct.pack(
+            "<10I4I",
+            round(1_000_000 / self._rate), 0, 0, AVIF_HASINDEX,
+            0, 0, 1, 0, width, height,
+            0, 0, 0, 0,
+        ))
+
+        f.write(b"LIST" + struct.pack("<I", 4 + 64 + 48) + b"strl")
+        f.write(b"strh" + struct.pack("<I", 56))
+        self._strh_offset = f.tell()
+        f.write(b"vids" + b"MJPG" + struct.pack(
+            "<IHHIIIIIIiI4h",
+            0, 0, 0, 0,
+            self._rate.denominator, self._rate.numerator,
+            0, 0, 0, -1, 0,
+            0, 0, width, height,
+        ))
+        f.write(b"strf" + struct.pack("<I", 40))
+        f.write(struct.pack(
+            "<IiiHH4sIiiII",
+            40, width, height, 1, 24, b"MJPG", width * height * 3,
+            0, 0, 0, 0,
+        ))
+
+        f.write(b"LIST" + struct.pack("<I", 0) + b"movi")
+        self._movi_offset = f.tell() - 4
+
+    # ====== PUBLIC METHODS ====== #
+
+    def write(self, jpeg: bytes) -> None:
+        """
+        Appends a JPEG encoded frame.
+
+        Args:
+            jpeg (bytes): The encoded frame.
+        """
+        offset = self._file.tell() - self._movi_offset
+        self._file.write(b"00dc" + struct.pack("<I", len(jpeg)))
+        self._file.write(jpeg)
+        if len(jpeg) % 2:
+            self._file.write(b"\0")
+        self._index.append((offset, len(jpeg)))
+        self._max_frame_size = max(self._max_frame_size, len(jpeg))
+
+    def release(self) -> None:
+        """
+        Writes the index, patches the headers and closes the file.
+        """
+        f = self._file
+        movi_end = f.tell()
+
+        f.write(b"idx1" + struct.pack("<I", 16 * len(self._index)))
+        for offset, size in self._index:
+            f.write(b"00dc" + struct.pack("<III", AVIIF_KEYFRAME, offset, size))
+        file_end = f.tell()
+
+        frames = len(self._index)
+        buffer_size = self._max_frame_size + 8
+
+        f.seek(4)
+        f.write(struct.pack("<I", file_end - 8))
+        f.seek(self._movi_offset - 4)
+        f.write(struct.pack("<I", movi_end - self._movi_offset))
+        f.seek(self._avih_offset + 16)
+        f.write(struct.pack("<I", frames))
+        f.seek(self._avih_offset + 28)
+        f.write(struct.pack("<I", buffer_size))
+        f.seek(self._strh_offset + 32)
+        f.write(struct.pack("<II", frames, buffer_size))
+
+        f.close()
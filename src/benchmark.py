@@ -0,0 +1,331 @@
+"""
+This file contains the headless benchmark suite.
+
+Every benchmark scene is generated from a number of cubes, cat models and
+animated objects, written as a scene file and loaded into a HeadlessEngine
+on a standalone context, so the suite runs on CPU-only machines. For each
+scene it measures:
+
+    load_s       loading the scene file, uploads included
+    frame_ms     median steady-state frame time, GPU work included
+    update_ms    mean cost of `update_objects` per frame, best pass
+    export_fps   frames per second through the render path of the
+                 animation widget: update, render, readback and encode
+
+Results are JSON documents that can be stored as a baseline. A metric
+regresses when it is worse than the baseline by more than the relative
+tolerance and by more than the absolute noise floor of the metric.
+"""
+from __future__ import annotations
+
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+
+import numpy as np
+
+from src.animation import KeyFrameTimeline, update_objects
+from src.constants import BENCHMARK_CONSTANTS, GUI_ANIMATION_WIDGET_CONSTANTS
+from src.frame_reader import FrameReader
+from src.headless_engine import HeadlessEngine
+from src.video_export import FrameEncoder
+
+
+SCENES = {
+    "cubes_1000": {"cubes": 1000, "cats": 0, "animated": 0},
+    "cats_16": {"cubes": 0, "cats": 16, "animated": 0},
+    "mixed_static": {"cubes": 200, "cats": 4, "animated": 0},
+    "mixed_animated": {"cubes": 200, "cats": 4, "animated": 100},
+}
+
+# Whether larger values are better, and the smallest difference that
+# counts as a change, in the unit of the metric.
+METRICS = {
+    "load_s": (False, 0.05),
+    "frame_ms": (False, 1.0),
+    "update_ms": (False, 0.1),
+    "export_fps": (True, 1.0),
+}
+
+CUBE_TEXTURE = "src/textures/crate.png"
+CAT_OBJECT = "src/models/cat/20430_Cat_v1_NEW.obj"
+CAT_TEXTURE = "src/models/cat/20430_cat_diff_v1.jpg"
+
+
+def generate_scene(
+        path: str,
+        cubes: int,
+        cats: int,
+        animated: int,
+        frames: int = BENCHMARK_CONSTANTS.FRAMES
+        ) -> None:
+    """
+    Writes a scene file with objects on a grid in front of the default
+    camera. The first `animated` objects get key frames moving and turning
+    them over the frames.
+
+    :param path: The path of the scene file.
+    :param cubes: The number of cubes.
+    :param cats: The number of cat models.
+    :param animated: The number of animated objects.
+    :param frames: The number of frames of the animation.
+    """
+    count = cubes + cats
+    side = max(1, int(np.ceil(np.sqrt(count))))
+    objects, key_frames = [], {}
+    for i in range(count):
+        row, column = divmod(i, side)
+        pos = [
+            (column - side / 2) * 1.5,
+            ((row % 8) - 4) * 1.5,
+            -6.0 - 2.0 * (row // 8),
+        ]
+        if i < cubes:
+            obj = {
+                "type": "cube",
+                "name": f"Cube {i}",
+                "texture_path": CUBE_TEXTURE,
+                "object_path": None,
+                "pos": pos,
+                "rot": [0, 0, 0],
+                "scale": [0.5, 0.5, 0.5],
+            }
+        else:
+            obj = {
+                "type": "model3d",
+                "name": f"Cat {i - cubes}",
+                "texture_path": CAT_TEXTURE,
+                "object_path": CAT_OBJECT,
+                "pos": pos,
+                "rot": [-90, 0, 0],
+                "scale": [0.05, 0.05, 0.05],
+            }
+        objects.append(obj)
+
+        if i < animated:
+            end = [pos[0], pos[1] + 1, pos[2]]
+            key_frames[obj["name"]] = {
+                "0": {"pos": pos, "rot": obj["rot"], "scale": obj["scale"]},
+                str(frames // 2): {
+                    "pos": end, "rot": [0, 180, 0], "scale": obj["scale"]
+                },
+                str(frames - 1): {
+                    "pos": pos, "rot": [0, 360, 0], "scale": obj["scale"]
+                },
+            }
+
+    with open(path, "w") as f:
+        json.dump({
+            "frames": {"start": 0, "end": frames - 1},
+            "objects": objects,
+            "key_frames": key_frames,
+        }, f)
+
+
+def _measure_frames(engine: HeadlessEngine) -> float:
+    """
+    Returns the median steady-state frame time.
+
+    :param engine: The engine with the scene loaded.
+    """
+    for _ in range(BENCHMARK_CONSTANTS.WARMUP_FRAMES):
+        engine.render_frame()
+    engine.mgl_context.finish()
+
+    times = []
+    for _ in range(BENCHMARK_CONSTANTS.STEADY_FRAMES):
+        start = time.perf_counter()
+        engine.render_frame()
+        engine.mgl_context.finish()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def _measure_updates(
+        engine: HeadlessEngine,
+        timeline: KeyFrameTimeline,
+        frames: tuple[int, int]
+        ) -> float:
+    """
+    Returns the mean cost of updating the objects to a frame, over the
+    fastest of a few passes through the animation. Single updates take well
+    under a millisecond, so they are timed in passes, and the fastest pass
+    is the one least disturbed by the rest of the system.
+
+    :param engine: The engine with the scene loaded.
+    :param timeline: The key frames of the scene.
+    :param frames: The first and last frame of the animation.
+    """
+    frame_range = range(frames[0], frames[1] + 1)
+    times = []
+    for _ in range(BENCHMARK_CONSTANTS.UPDATE_PASSES):
+        start = time.perf_counter()
+        for frame in frame_range:
+            update_objects(engine.scene, timeline, frame)
+        times.append(time.perf_counter() - start)
+    return min(times) / len(frame_range) * 1000
+
+
+def _measure_export(
+        engine: HeadlessEngine,
+        timeline: KeyFrameTimeline,
+        directory: str
+        ) -> float:
+    """
+    Returns the frames per second of an export through the render path of
+    the animation widget.
+
+    :param engine: The engine with the scene loaded.
+    :param timeline: The key frames of the scene.
+    :param directory: The directory for the video file.
+    """
+    encoder = FrameEncoder(
+        engine.win_size,
+        os.path.join(directory, "export"),
+        GUI_ANIMATION_WIDGET_CONSTANTS.OUTPUT_FPS
+    )
+    reader = FrameReader(
+        engine.mgl_context, engine.framebuffer,
+        pool_size=encoder.queue_size + 2
+    )
+    frames = BENCHMARK_CONSTANTS.EXPORT_FRAMES
+    start = time.perf_counter()
+    for frame in range(frames):
+        update_objects(engine.scene, timeline, frame)
+        engine.render_frame()
+        img = reader.read()
+        if img is not None:
+            encoder.write(img)
+    for img in reader.flush():
+        encoder.write(img)
+    reader.release()
+    encoder.close()
+    return frames / (time.perf_counter() - start)
+
+
+def measure_scene(
+        path: str,
+        directory: str,
+        size: tuple[int, int],
+        backend: str = None
+        ) -> dict[str, float]:
+    """
+    Measures a scene file on a fresh engine, so the load decodes and
+    uploads every asset instead of hitting the caches of an earlier load.
+
+    :param path: The path of the scene file.
+    :param directory: The directory for the exported video.
+    :param size: The size of the framebuffer.
+    :param backend: The glcontext backend, see `HeadlessEngine`.
+
+    Returns:
+        dict[str, float]: The value of every metric.
+    """
+    engine = HeadlessEngine(size, backend)
+    try:
+        start = time.perf_counter()
+        key_frames, frames = engine.load_scene(path)
+        load_s = time.perf_counter() - start
+
+        timeline = KeyFrameTimeline(key_frames)
+        return {
+            "load_s": load_s,
+            "frame_ms": _measure_frames(engine),
+            "update_ms": _measure_updates(engine, timeline, frames),
+            "export_fps": _measure_export(engine, timeline, directory),
+        }
+    finally:
+        engine.destroy()
+
+
+def run_benchmarks(
+        scenes: list[str] = None,
+        backend: str = None,
+        size: tuple[int, int] = (
+            BENCHMARK_CONSTANTS.WIDTH, BENCHMARK_CONSTANTS.HEIGHT
+        ),
+        repeats: int = BENCHMARK_CONSTANTS.REPEATS
+        ) -> dict:
+    """
+    Runs the benchmark scenes. Every scene is loaded once beforehand to
+    bake its models, which the application does once per model, and then
+    measured `repeats` times. The median of each metric is kept, so a
+    single slow or fast run does not decide the result.
+
+    :param scenes: The names of the scenes to run, all by default.
+    :param backend: The glcontext backend, see `HeadlessEngine`.
+    :param size: The size of the framebuffer.
+    :param repeats: The number of runs per scene.
+
+    Returns:
+        dict: The results, with the machine they were measured on.
+    """
+    results = {"machine": None, "size": list(size), "scenes": {}}
+    for name in scenes or SCENES:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "scene.json")
+            generate_scene(path, **SCENES[name])
+
+            engine = HeadlessEngine(size, backend)
+            try:
+                engine.load_scene(path)
+                results["machine"] = {
+                    "platform": platform.platform(),
+                    "python": platform.python_version(),
+                    "renderer": engine.mgl_context.info["GL_RENDERER"],
+                }
+            finally:
+                engine.destroy()
+
+            runs = [
+                measure_scene(path, directory, size, backend)
+                for _ in range(repeats)
+            ]
+        results["scenes"][name] = {
+            metric: statistics.median(run[metric] for run in runs)
+            for metric in runs[0]
+        }
+    return results
+
+
+def compare(
+        results: dict,
+        baseline: dict,
+        tolerance: float = BENCHMARK_CONSTANTS.TOLERANCE
+        ) -> tuple[list[str], list[str]]:
+    """
+    Compares results with a baseline.
+
+    :param results: The results, see `run_benchmarks`.
+    :param baseline: The baseline results.
+    :param tolerance: The relative change that is still accepted.
+
+    Returns:
+        tuple[list[str], list[str]]: A line per compared metric and a line
+        per regression.
+    """
+    lines, regressions = [], []
+    for scene, metrics in results["scenes"].items():
+        base_metrics = baseline.get("scenes", {}).get(scene)
+        if base_metrics is None:
+            lines.append(f"{scene}: no baseline")
+            continue
+        for metric, value in metrics.items():
+            if metric not in base_metrics:
+                continue
+            base = base_metrics[metric]
+            higher_is_better, noise = METRICS[metric]
+            worse = base - value if higher_is_better else value - base
+            change = (value - base) / base if base else 0.0
+            line = (
+                f"{scene:<16}{metric:<12}{base:>10.3f}{value:>10.3f}"
+                f"{change:>+9.1%}"
+            )
+            if worse > noise and worse > tolerance * base:
+                line += "  REGRESSION"
+                regressions.append(line)
+            lines.append(line)
+    return lines, regressions
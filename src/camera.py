@@ -17,18 +17,27 @@ from src.constants import CAMERA_CONSTANTS
 class Camera:
     """
     Class for a camera abstraction.
+
+    The projection and view matrices are cached and only rebuilt after the
+    aspect ratio or the position and orientation changed; every such change
+    increments `version`.
     """
 
     def __init__(self, app: GraphicsEngine) -> None:
         self._app = app
         self._aspect_ratio = app.win_size[0] / app.win_size[1]
 
-        self._position = CAMERA_CONSTANTS.DEFAULT_CAMERA_POSITION
-        self._forward = CAMERA_CONSTANTS.DEFAULT_CAMERA_FORWARD
-        self._up = CAMERA_CONSTANTS.DEFAULT_CAMERA_UP
-        self._right = CAMERA_CONSTANTS.DEFAULT_CAMERA_RIGHT
+        self._position = glm.vec3(CAMERA_CONSTANTS.DEFAULT_CAMERA_POSITION)
+        self._forward = glm.vec3(CAMERA_CONSTANTS.DEFAULT_CAMERA_FORWARD)
+        self._up = glm.vec3(CAMERA_CONSTANTS.DEFAULT_CAMERA_UP)
+        self._right = glm.vec3(CAMERA_CONSTANTS.DEFAULT_CAMERA_RIGHT)
         self._yaw = CAMERA_CONSTANTS.DEFAULT_CAMERA_YAW
         self._pitch = CAMERA_CONSTANTS.DEFAULT_CAMERA_PITCH
+        self._update_camera_vectors()
+
+        self._m_proj = None
+        self._m_view = None
+        self._version = 0
 
     # ====== PROPERTIES ====== #
 
@@ -37,14 +46,68 @@ class Camera:
         """
         [READ-ONLY] glm.mat4: The projection matrix for the camera.
         """
-        return self._get_projection_matrix()
+        if self._m_proj is None:
+            self._m_proj = self._get_projection_matrix()
+        return self._m_proj
 
     @property
     def m_view(self) -> glm.mat4:
         """
         [READ-ONLY] glm.mat4: The view matrix for the camera.
         """
-        return self._get_view_matrix()
+        if self._m_view is None:
+            self._m_view = self._get_view_matrix()
+        return self._m_view
+
+    @property
+    def position(self) -> glm.vec3:
+        """
+        [READ-ONLY] glm.vec3: The position of the camera.
+        """
+        return self._position
+
+    @property
+    def yaw(self) -> float:
+        """
+        [READ-ONLY] float: The yaw of the camera, in degrees.
+        """
+        return self._yaw
+
+    @property
+    def pitch(self) -> float:
+        """
+        [READ-ONLY] float: The pitch of the camera, in degrees.
+        """
+        return self._pitch
+
+    @property
+    def version(self) -> int:
+        """
+        [READ-ONLY] int: A counter increased whenever the projection or view
+        matrix changes.
+        """
+        return self._version
+
+    @property
+    def aspect_ratio(self) -> float:
+        """
+        float: The aspect ratio of the camera.
+        """
+        return self._aspect_ratio
+
+    @aspect_ratio.setter
+    def aspect_ratio(self, aspect_ratio: float) -> None:
+        """
+        Sets the aspect ratio of the camera.
+
+        Args:
+            aspect_ratio (float): The aspect ratio.
+        """
+        if aspect_ratio == self._aspect_ratio:
+            return
+        self._aspect_ratio = aspect_ratio
+        self._m_proj = None
+        self._version += 1
 
     # ====== PRIVATE METHODS ====== #
 
@@ -73,9 +136,12 @@ class Camera:
             self._position, self._position + self._forward, self._up
         )
 
-    def _move(self) -> None:
+    def _move(self) -> bool:
         """
         Moves the camera.
+
+        Returns:
+            bool: True if the camera moved.
         """
         velocity = CAMERA_CONSTANTS.DEFAULT_CAMERA_SPEED * 3
         direction = self._app._key_pressed
@@ -103,15 +169,24 @@ class Camera:
             self._position[0] -= velocity * self._up[0]
             self._position[1] -= velocity * self._up[1]
             self._position[2] -= velocity * self._up[2]
+        else:
+            return False
+        return True
 
-    def _rotate(self) -> None:
+    def _rotate(self) -> bool:
         """
         Rotates the camera.
+
+        Returns:
+            bool: True if the camera rotated.
         """
         x, y = self._app._mouse_move
+        if x == 0 and y == 0:
+            return False
         self._yaw += x * CAMERA_CONSTANTS.DEFAULT_CAMERA_SENSITIVITY / 50
         self._pitch -= y * CAMERA_CONSTANTS.DEFAULT_CAMERA_SENSITIVITY / 50
         self._pitch = max(-89.0, min(89.0, self._pitch))
+        return True
 
     def _update_camera_vectors(self) -> None:
         """
@@ -131,10 +206,33 @@ class Camera:
 
     # ====== PUBLIC METHODS ====== #
 
-    def update(self) -> None:
+    def set_view(
+        self, position: tuple[float], yaw: float, pitch: float
+    ) -> None:
         """
-        Updates the camera.
+        Moves and turns the camera, e.g. to the view saved with a scene.
+
+        Args:
+            position (tuple[float]): The position of the camera.
+            yaw (float): The yaw, in degrees.
+            pitch (float): The pitch, in degrees, clamped like mouse input.
         """
-        self._move()
-        self._rotate()
+        self._position = glm.vec3(position)
+        self._yaw = yaw
+        self._pitch = max(-89.0, min(89.0, pitch))
         self._update_camera_vectors()
+        self._m_view = None
+        self._version += 1
+
+    def update(self) -> None:
+        """
+        Updates the camera from the input, rebuilding nothing when there is
+        none.
+        """
+        moved = self._move()
+        rotated = self._rotate()
+        if rotated:
+            self._update_camera_vectors()
+        if moved or rotated:
+            self._m_view = None
+            self._version += 1
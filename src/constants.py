@@ -44,6 +44,79 @@ class GUI_ANIMATION_WIDGET_CONSTANTS:
     HEIGHT: int = 120
     OUTPUT_FPS: float = 30.0
     OUTPUT_FILE_NAME: str = "output"
+    SCENE_FILE_NAME: str = "scene.json"
+
+
+class HEADLESS_CONSTANTS:
+    """
+    Constants for the headless renderer config.
+    """
+
+    WIDTH: int = 1280
+    HEIGHT: int = 720
+    EGL_BACKEND: str = "egl"
+
+
+class EXPORT_CONSTANTS:
+    """
+    Constants for the animation export config.
+    """
+
+    READBACK_RING_SIZE: int = 2
+    ENCODER_QUEUE_SIZE: int = 8
+    JPEG_QUALITY: int = 95
+    SEGMENT_SUFFIX: str = ".part"
+    POSE_CHUNK_SIZE: int = 256
+
+
+class STARTUP_CONSTANTS:
+    """
+    Constants for the startup trace config.
+    """
+
+    BUDGET_S: float = 3.0
+    MODULES: tuple[str] = (
+        "moderngl",
+        "PIL.Image",
+        "PyQt5.QtWidgets",
+        "PyQt5.QtOpenGL",
+        "src.graphics_engine",
+        "src.window.main_window",
+    )
+    DEFERRED_MODULES: tuple[str] = ("cv2", "pywavefront")
+
+
+class BENCHMARK_CONSTANTS:
+    """
+    Constants for the benchmark suite config.
+    """
+
+    WIDTH: int = 640
+    HEIGHT: int = 360
+    FRAMES: int = 120
+    WARMUP_FRAMES: int = 5
+    STEADY_FRAMES: int = 30
+    EXPORT_FRAMES: int = 30
+    UPDATE_PASSES: int = 5
+    REPEATS: int = 3
+    TOLERANCE: float = 0.3
+    BASELINE_FILE_NAME: str = "benchmarks/baseline.json"
+
+
+class PROFILER_CONSTANTS:
+    """
+    Constants for the frame profiler config.
+    """
+
+    ENABLED: bool = False
+    WINDOW: int = 240
+    HISTORY: int = 100_000
+    OVERLAY_INTERVAL_MS: int = 500
+    OVERLAY_STYLE: str = (
+        "background-color: rgba(0, 0, 0, 160); color: white;"
+        "font-family: monospace; padding: 4px;"
+    )
+    DUMP_FILE_NAME: str = "profile.json"
 
 
 class OPENGL_CONSTANTS:
@@ -57,12 +130,45 @@ class OPENGL_CONSTANTS:
     DEFAULT_SCENE_COLOUR: tuple[float] = (0.08, 0.16, 0.18)
 
     DEFAULT_SHADER: str = "default"
+    INSTANCED_SHADER_SUFFIX: str = "_instanced"
+    INSTANCED_RENDERING: bool = True
+    FRUSTUM_CULLING: bool = True
+    LOD_SELECTION: bool = True
+
+    FRAMES_IN_FLIGHT: int = 2
+    MAX_FRAMES_IN_FLIGHT: int = 3
+    FENCE_TIMEOUT_NS: int = 100_000_000
+
+    FRAME_UNIFORM_BLOCK: str = "FrameData"
+    FRAME_UNIFORM_BINDING: int = 0
+
+    TEXTURE_VRAM_BUDGET: int = 256 * 1024 * 1024
+
+    ASSET_LOADER_WORKERS: int = 2
+    PLACEHOLDER_TEXTURE: str = "src/textures/crate.png"
 
     DEFAULT_POSITION: tuple[float] = (0, 0, 0)
     DEFAULT_ROTATION: tuple[float] = (0, 0, 0)
     DEFAULT_SCALE: tuple[float] = (1, 1, 1)
 
 
+class MESH_CONSTANTS:
+    """
+    Constants for mesh loading config.
+    """
+
+    VERTEX_FORMAT: str = "T2F_N3F_V3F"
+    FLOATS_PER_VERTEX: int = 8
+    BAKED_MESH_EXTENSION: str = ".mesh"
+    BAKED_MESH_MAGIC: bytes = b"GKOMMESH"
+    BAKED_MESH_VERSION: int = 2
+
+    LOD_GRID_SIZES: tuple[int] = (48, 16)
+    LOD_MIN_REDUCTION: float = 0.75
+    LOD_SCREEN_SIZES: tuple[float] = (0.3, 0.1)
+    LOD_HYSTERESIS: float = 0.2
+
+
 class CAMERA_CONSTANTS:
     """
     Constants for camera config.
@@ -0,0 +1,212 @@
+"""
+This file contains the FramePacer class, which bounds the number of frames
+the GPU may lag behind the CPU with OpenGL sync fences.
+"""
+from __future__ import annotations
+
+import ctypes
+import logging
+import sys
+from collections import deque
+from ctypes.util import find_library
+from typing import Callable
+
+import moderngl as mgl
+
+from src.constants import OPENGL_CONSTANTS
+
+
+GL_SYNC_GPU_COMMANDS_COMPLETE = 0x9117
+GL_SYNC_FLUSH_COMMANDS_BIT = 0x00000001
+GL_TIMEOUT_EXPIRED = 0x911B
+GL_WAIT_FAILED = 0x911D
+
+
+def _get_proc_address() -> Callable[[str], int]:
+    """
+    Returns a function resolving OpenGL functions of the current context,
+    as moderngl does not expose sync objects.
+
+    Returns:
+        Callable[[str], int]: Returns the address of a function, or 0.
+
+    Raises:
+        OSError: If the OpenGL library cannot be found.
+    """
+    def address(lib, name: str) -> int:
+        return ctypes.cast(getattr(lib, name, 0), ctypes.c_void_p).value or 0
+
+    if sys.platform.startswith("win"):
+        lib = ctypes.WinDLL("opengl32.dll")
+        proc = ctypes.WINFUNCTYPE(ctypes.c_void_p, ctypes.c_char_p)(
+            ("wglGetProcAddress", lib)
+        )
+        return lambda name: proc(name.encode()) or address(lib, name)
+
+    if sys.platform.startswith("darwin"):
+        lib = ctypes.CDLL("/System/Library/Frameworks/OpenGL.framework/OpenGL")
+        return lambda name: address(lib, name)
+
+    libegl = find_library("EGL")
+    if libegl is not None:
+        lib = ctypes.CDLL(libegl)
+        if lib.eglGetCurrentContext():
+            proc = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_char_p)(
+                ("eglGetProcAddress", lib)
+            )
+            return lambda name: proc(name.encode()) or 0
+
+    libgl = find_library("GL")
+    if libgl is None:
+        raise OSError("Cannot find libGL")
+    lib = ctypes.CDLL(libgl)
+    proc = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_char_p)(
+        ("glXGetProcAddress", lib)
+    )
+    return lambda name: proc(name.encode()) or address(lib, name)
+
+
+class FramePacer:
+    """
+    Class for pacing frames with sync fences instead of a full pipeline
+    stall.
+
+    After every frame a fence is queued behind its commands. The CPU only
+    waits once more than `frames_in_flight` fences are pending, and then
+    only for the oldest frame, so it prepares the next frames while the GPU
+    still draws the previous ones. One frame in flight is the low latency
+    mode, equivalent to finishing every frame; more frames trade latency for
+    throughput. Where fences are not available every frame is finished.
+    """
+
+    def __init__(
+        self,
+        ctx: mgl.Context,
+        frames_in_flight: int = OPENGL_CONSTANTS.FRAMES_IN_FLIGHT
+    ) -> None:
+        self._ctx = ctx
+        self._frames_in_flight = 1
+        self.frames_in_flight = frames_in_flight
+        self._fences = deque()
+        self._functions = None
+        self._supported = True
+        self._waits = 0
+
+    # ====== PROPERTIES ====== #
+
+    @property
+    def frames_in_flight(self) -> int:
+        """
+        int: The number of frames the GPU may lag behind, between 1 and
+        `OPENGL_CONSTANTS.MAX_FRAMES_IN_FLIGHT`.
+        """
+        return self._frames_in_flight
+
+    @frames_in_flight.setter
+    def frames_in_flight(self, frames_in_flight: int) -> None:
+        self._frames_in_flight = max(
+            1, min(frames_in_flight, OPENGL_CONSTANTS.MAX_FRAMES_IN_FLIGHT)
+        )
+
+    @property
+    def waits(self) -> int:
+        """
+        [READ-ONLY] int: The number of frames the CPU had to wait for the
+        GPU so far.
+        """
+        return self._waits
+
+    # ====== PRIVATE METHODS ====== #
+
+    def _load_functions(self) -> tuple | None:
+        """
+        Loads the sync functions of the current context on first use.
+
+        Returns:
+            tuple | None: glFenceSync, glClientWaitSync and glDeleteSync, or
+            None if they are not available.
+        """
+        if self._functions is not None or not self._supported:
+            return self._functions
+
+        functype = ctypes.CFUNCTYPE
+        if sys.platform.startswith("win"):
+            functype = ctypes.WINFUNCTYPE
+        signatures = {
+            "glFenceSync": functype(
+                ctypes.c_void_p, ctypes.c_uint, ctypes.c_uint
+            ),
+            "glClientWaitSync": functype(
+                ctypes.c_uint, ctypes.c_void_p, ctypes.c_uint, ctypes.c_uint64
+            ),
+            "glDeleteSync": functype(None, ctypes.c_void_p),
+        }
+        try:
+            get_proc_address = _get_proc_address()
+            addresses = {
+                name: get_proc_address(name) for name in signatures
+            }
+        except (OSError, AttributeError) as err:
+            addresses = {}
+            logging.warning(f"Could not load sync fences: {err}")
+
+        if not addresses or not all(addresses.values()):
+            logging.warning("Sync fences unavailable, finishing every frame")
+            self._supported = False
+            return None
+
+        self._functions = tuple(
+            signature(addresses[name])
+            for name, signature in signatures.items()
+        )
+        return self._functions
+
+    def _wait(self, fence: int) -> None:
+        """
+        Waits until the GPU has passed a fence and deletes it.
+
+        Args:
+            fence (int): The fence.
+        """
+        _, client_wait_sync, delete_sync = self._functions
+        result = client_wait_sync(fence, GL_SYNC_FLUSH_COMMANDS_BIT, 0)
+        if result == GL_TIMEOUT_EXPIRED:
+            self._waits += 1
+            while result == GL_TIMEOUT_EXPIRED:
+                result = client_wait_sync(
+                    fence,
+                    GL_SYNC_FLUSH_COMMANDS_BIT,
+                    OPENGL_CONSTANTS.FENCE_TIMEOUT_NS
+                )
+        if result == GL_WAIT_FAILED:
+            logging.warning("Waiting for a sync fence failed")
+        delete_sync(fence)
+
+    # ====== PUBLIC METHODS ====== #
+
+    def end_frame(self) -> None:
+        """
+        Queues a fence behind the commands of the frame and waits for the
+        oldest frames until at most `frames_in_flight` are pending. Must be
+        called with the GL context current.
+        """
+        functions = self._load_functions()
+        if functions is None:
+            self._ctx.finish()
+            return
+
+        fence_sync = functions[0]
+        self._fences.append(fence_sync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0))
+        while len(self._fences) > self._frames_in_flight:
+            self._wait(self._fences.popleft())
+
+    def release(self) -> None:
+        """
+        Deletes the pending fences. Must be called with the GL context
+        current.
+        """
+        if self._functions is not None:
+            delete_sync = self._functions[2]
+            for fence in self._fences:
+                delete_sync(fence)
+        self._fences.clear()
@@ -0,0 +1,252 @@
+"""
+This file contains the FrameProfiler class, which measures where the time
+of a frame goes.
+"""
+from __future__ import annotations
+
+import csv
+import json
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import Iterator
+
+import moderngl as mgl
+import numpy as np
+
+from src.constants import OPENGL_CONSTANTS, PROFILER_CONSTANTS
+
+
+class FrameProfiler:
+    """
+    Class for per-phase CPU and GPU timings of frames.
+
+    Code runs in named CPU phases, timed with `time.perf_counter`, and draw
+    calls in named GPU sections, timed with time elapsed queries. Query
+    results are read a few frames later, once the GPU is done with them, so
+    profiling does not stall the pipeline. The last `window` samples of
+    every phase give rolling percentiles, and every sample is kept in a
+    bounded history for `dump`. While disabled, phases and sections cost a
+    single attribute lookup.
+    """
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(
+        self,
+        ctx: mgl.Context,
+        enabled: bool = PROFILER_CONSTANTS.ENABLED,
+        window: int = PROFILER_CONSTANTS.WINDOW,
+        history: int = PROFILER_CONSTANTS.HISTORY
+    ) -> None:
+        self._ctx = ctx
+        self._enabled = enabled
+        self._window = window
+        self._samples = {}
+        self._history = deque(maxlen=history)
+        self._frame = 0
+        self._frame_start = None
+        self._queries = []
+        self._pending = deque()
+        self._free_queries = []
+
+    # ====== PROPERTIES ====== #
+
+    @property
+    def enabled(self) -> bool:
+        """
+        bool: Whether frames are profiled.
+        """
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled: bool) -> None:
+        """
+        Sets whether frames are profiled.
+
+        Args:
+            enabled (bool): True to profile.
+        """
+        self._enabled = enabled
+
+    # ====== PRIVATE METHODS ====== #
+
+    def _add_sample(self, kind: str, name: str, ms: float) -> None:
+        """
+        Records a timing.
+
+        Args:
+            kind (str): "cpu" or "gpu".
+            name (str): The name of the phase.
+            ms (float): The time in milliseconds.
+        """
+        key = (kind, name)
+        if key not in self._samples:
+            self._samples[key] = deque(maxlen=self._window)
+        self._samples[key].append(ms)
+        self._history.append((self._frame, kind, name, ms))
+
+    @contextmanager
+    def _time_phase(self, name: str) -> Iterator[None]:
+        """
+        Times a CPU phase.
+
+        Args:
+            name (str): The name of the phase.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add_sample(
+                "cpu", name, (time.perf_counter() - start) * 1000
+            )
+
+    def _resolve(self, queries: list) -> None:
+        """
+        Reads the results of the GPU sections of a frame and recycles their
+        queries.
+
+        Args:
+            queries (list): The sections and their queries.
+        """
+        total = 0.0
+        for name, query in queries:
+            ms = query.elapsed / 1e6
+            total += ms
+            self._add_sample("gpu", name, ms)
+            self._free_queries.append(query)
+        if queries:
+            self._add_sample("gpu", "frame", total)
+
+    # ====== PUBLIC METHODS ====== #
+
+    def begin_frame(self) -> None:
+        """
+        Starts a frame, ending the previous one if it is still open.
+        """
+        if not self._enabled:
+            return
+        if self._frame_start is not None:
+            self.end_frame()
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self) -> None:
+        """
+        Ends the frame and reads the GPU sections of the frames the GPU
+        has finished.
+        """
+        if self._frame_start is None:
+            return
+        self._add_sample(
+            "cpu", "frame", (time.perf_counter() - self._frame_start) * 1000
+        )
+        self._frame_start = None
+        self._frame += 1
+
+        self._pending.append(self._queries)
+        self._queries = []
+        while len(self._pending) > OPENGL_CONSTANTS.MAX_FRAMES_IN_FLIGHT:
+            self._resolve(self._pending.popleft())
+
+    def phase(self, name: str):
+        """
+        Returns a context manager timing a CPU phase.
+
+        Args:
+            name (str): The name of the phase.
+
+        Returns:
+            ContextManager: Times the code it wraps.
+        """
+        if not self._enabled:
+            return nullcontext()
+        return self._time_phase(name)
+
+    def gpu(self, name: str):
+        """
+        Returns a context manager timing the GPU work of the draw calls it
+        wraps. Sections must not be nested.
+
+        Args:
+            name (str): The name of the section, e.g. an object or batch.
+
+        Returns:
+            ContextManager: Times the draw calls it wraps.
+        """
+        if not self._enabled:
+            return nullcontext()
+        if self._free_queries:
+            query = self._free_queries.pop()
+        else:
+            query = self._ctx.query(time=True)
+        self._queries.append((name, query))
+        return query
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """
+        Returns the rolling percentiles of every phase.
+
+        Returns:
+            dict: The p50, p95 and p99 in milliseconds, by "kind/name".
+        """
+        stats = {}
+        for (kind, name), samples in self._samples.items():
+            values = np.percentile(
+                np.fromiter(samples, float), self.PERCENTILES
+            )
+            stats[f"{kind}/{name}"] = {
+                f"p{p}": float(v) for p, v in zip(self.PERCENTILES, values)
+            }
+        return stats
+
+    def report(self) -> str:
+        """
+        Returns the rolling percentiles as a table.
+
+        Returns:
+            str: One line per phase.
+        """
+        lines = [f"{'phase':<28}{'p50':>8}{'p95':>8}{'p99':>8}  ms"]
+        for name, values in self.stats().items():
+            lines.append(
+                f"{name[:27]:<28}" + "".join(
+                    f"{value:>8.2f}" for value in values.values()
+                )
+            )
+        return "\n".join(lines)
+
+    def dump(self, path: str) -> None:
+        """
+        Writes every recorded sample for offline analysis, as CSV if the
+        path ends with ".csv" and as JSON with the percentiles otherwise.
+
+        Args:
+            path (str): The path of the file.
+        """
+        fields = ("frame", "kind", "phase", "ms")
+        if path.endswith(".csv"):
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(fields)
+                writer.writerows(self._history)
+            return
+
+        with open(path, "w") as f:
+            json.dump({
+                "summary": self.stats(),
+                "samples": [dict(zip(fields, row)) for row in self._history],
+            }, f)
+
+    def release(self) -> None:
+        """
+        Reads the remaining GPU sections and drops the queries, which
+        moderngl frees with the context. Must be called with the GL context
+        current.
+        """
+        self.end_frame()
+        self._pending.append(self._queries)
+        self._queries = []
+        while self._pending:
+            self._resolve(self._pending.popleft())
+        self._free_queries = []
@@ -0,0 +1,118 @@
+"""
+This file contains the FrameReader class, which reads rendered frames back
+to the CPU through a ring of pixel buffer objects.
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterator
+
+import moderngl as mgl
+import numpy as np
+
+from src.constants import EXPORT_CONSTANTS
+
+
+class FrameReader:
+    """
+    Class for asynchronous framebuffer readback.
+
+    Every call to `read` queues a copy of the framebuffer into the next pixel
+    buffer object and returns the oldest queued frame once the ring is full,
+    so frame N is mapped while frame N+1 renders. Frames are returned as
+    top-down BGR images in a pool of reusable NumPy buffers; a returned frame
+    stays valid until `pool_size` further frames have been returned.
+    """
+
+    def __init__(
+        self,
+        ctx: mgl.Context,
+        framebuffer: mgl.Framebuffer,
+        ring_size: int = EXPORT_CONSTANTS.READBACK_RING_SIZE,
+        pool_size: int = None
+    ) -> None:
+        self._ctx = ctx
+        self._framebuffer = framebuffer
+        self._ring_size = max(1, ring_size)
+        self._pool_size = max(1, pool_size or self._ring_size)
+
+        width, height = framebuffer.size
+        self._size = (width, height)
+        self._pbos = [
+            ctx.buffer(reserve=width * height * 3)
+            for _ in range(self._ring_size)
+        ]
+        self._raw = np.empty((height, width, 3), dtype=np.uint8)
+        self._frames = [
+            np.empty((height, width, 3), dtype=np.uint8)
+            for _ in range(self._pool_size)
+        ]
+        self._pending = deque()
+        self._next_pbo = 0
+        self._next_frame = 0
+
+    # ====== PROPERTIES ====== #
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """
+        [READ-ONLY] Returns the size of the frames.
+
+        Returns:
+            tuple[int, int]: The width and height of the frames.
+        """
+        return self._size
+
+    # ====== PRIVATE METHODS ====== #
+
+    def _collect(self) -> np.ndarray:
+        """
+        Maps the oldest pixel buffer object and converts its contents.
+
+        Returns:
+            np.ndarray: The frame as a top-down BGR image.
+        """
+        pbo = self._pending.popleft()
+        pbo.read_into(self._raw)
+        frame = self._frames[self._next_frame]
+        self._next_frame = (self._next_frame + 1) % self._pool_size
+        np.copyto(frame, self._raw[::-1, :, ::-1])
+        return frame
+
+    # ====== PUBLIC METHODS ====== #
+
+    def read(self) -> np.ndarray | None:
+        """
+        Queues the readback of the current framebuffer contents.
+
+        Returns:
+            np.ndarray | None: The oldest queued frame once the ring is full,
+            None otherwise.
+        """
+        frame = None
+        if len(self._pending) == self._ring_size:
+            frame = self._collect()
+
+        pbo = self._pbos[self._next_pbo]
+        self._next_pbo = (self._next_pbo + 1) % self._ring_size
+        self._framebuffer.read_into(pbo, components=3)
+        self._pending.append(pbo)
+        return frame
+
+    def flush(self) -> Iterator[np.ndarray]:
+        """
+        Returns the frames that are still queued, oldest first.
+
+        Yields:
+            np.ndarray: The frame as a top-down BGR image.
+        """
+        while self._pending:
+            yield self._collect()
+
+    def release(self) -> None:
+        """
+        Releases the pixel buffer objects.
+        """
+        self._pending.clear()
+        for pbo in self._pbos:
+            pbo.release()
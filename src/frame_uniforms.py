@@ -0,0 +1,94 @@
+"""
+This file contains the FrameUniforms class.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.camera import Camera
+    from src.light import Light
+
+import glm
+import moderngl as mgl
+
+from src.constants import OPENGL_CONSTANTS
+
+
+class FrameUniforms:
+    """
+    Class for the uniform buffer holding the per-frame state shared by every
+    shader program: the camera matrices and position and the light.
+
+    The buffer follows the std140 layout of the `FrameData` block declared
+    in the shaders::
+
+        mat4 m_proj;     // offset 0
+        mat4 m_view;     // offset 64
+        vec3 camPos;     // offset 128
+        Light light;     // offset 144, four vec3 padded to 16 bytes each
+
+    It is written once per frame and bound to a fixed binding point, which
+    every program links its block to when it is compiled.
+    """
+
+    SIZE = 208
+
+    def __init__(self, ctx: mgl.Context) -> None:
+        self._buffer = ctx.buffer(reserve=self.SIZE)
+        self._camera_version = None
+        self._camera_data = b""
+        self._data = b""
+
+    # ====== PRIVATE METHODS ====== #
+
+    @staticmethod
+    def _pack_vec3(vector: glm.vec3) -> bytes:
+        """
+        Packs a vec3 padded to 16 bytes, as std140 aligns it.
+
+        Args:
+            vector (glm.vec3): The vector.
+
+        Returns:
+            bytes: The packed vector.
+        """
+        return glm.vec4(vector, 0.0).to_bytes()
+
+    # ====== PUBLIC METHODS ====== #
+
+    def update(self, camera: Camera, light: Light) -> None:
+        """
+        Writes the state of the camera and the light to the buffer, if it
+        changed since the last frame, and binds the buffer.
+
+        Args:
+            camera (Camera): The camera.
+            light (Light): The light.
+        """
+        if camera.version != self._camera_version:
+            self._camera_data = b"".join([
+                camera.m_proj.to_bytes(),
+                camera.m_view.to_bytes(),
+                self._pack_vec3(camera.position),
+            ])
+            self._camera_version = camera.version
+
+        data = b"".join([
+            self._camera_data,
+            self._pack_vec3(light.position),
+            self._pack_vec3(light.ambient),
+            self._pack_vec3(light.diffuse),
+            self._pack_vec3(light.specular),
+        ])
+        if data != self._data:
+            self._buffer.write(data)
+            self._data = data
+        self._buffer.bind_to_uniform_block(
+            OPENGL_CONSTANTS.FRAME_UNIFORM_BINDING
+        )
+
+    def release(self) -> None:
+        """
+        Releases the buffer.
+        """
+        self._buffer.release()
@@ -0,0 +1,136 @@
+"""
+This file contains the FrustumCuller class.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.camera import Camera
+    from src.objects.opengl_object import OpenGLObject
+
+import numpy as np
+
+
+class FrustumCuller:
+    """
+    Class for skipping objects outside of the view frustum of the camera.
+
+    The six frustum planes are extracted from the projection-view matrix
+    whenever the camera version changes. Each frame, the world space bounds
+    of all objects are tested against every plane in one vectorized pass;
+    an object is culled when its bounding sphere or its bounding box lies
+    entirely behind any plane. Objects without bounds yet, such as loading
+    ones, are always drawn.
+    """
+
+    UNBOUNDED = np.full(7, np.nan)
+
+    def __init__(self) -> None:
+        self._camera_version = None
+        self._normals = np.zeros((6, 3))
+        self._offsets = np.zeros(6)
+        self._drawn = 0
+        self._culled = 0
+        self._frames = 0
+        self._total_drawn = 0
+        self._total_culled = 0
+
+    # ====== PROPERTIES ====== #
+
+    @property
+    def drawn(self) -> int:
+        """
+        [READ-ONLY] int: The number of objects drawn in the last frame.
+        """
+        return self._drawn
+
+    @property
+    def culled(self) -> int:
+        """
+        [READ-ONLY] int: The number of objects culled in the last frame.
+        """
+        return self._culled
+
+    # ====== PRIVATE METHODS ====== #
+
+    def _update_planes(self, camera: Camera) -> None:
+        """
+        Extracts the frustum planes from the camera matrices, normalized so
+        that plane distances are in world units.
+
+        Args:
+            camera (Camera): The camera.
+        """
+        if camera.version == self._camera_version:
+            return
+
+        rows = np.array(camera.m_proj * camera.m_view, dtype="f8")
+        planes = np.array([
+            rows[3] + rows[0],
+            rows[3] - rows[0],
+            rows[3] + rows[1],
+            rows[3] - rows[1],
+            rows[3] + rows[2],
+            rows[3] - rows[2],
+        ])
+        lengths = np.linalg.norm(planes[:, :3], axis=1)
+        planes /= lengths[:, None]
+        self._normals = planes[:, :3]
+        self._offsets = planes[:, 3]
+        self._camera_version = camera.version
+
+    # ====== PUBLIC METHODS ====== #
+
+    def cull(
+        self, objects, camera: Camera
+    ) -> list[OpenGLObject]:
+        """
+        Returns the objects that may be visible to the camera.
+
+        Args:
+            objects (Iterable[OpenGLObject]): The objects of the scene.
+            camera (Camera): The camera.
+
+        Returns:
+            list[OpenGLObject]: The objects to draw, in order.
+        """
+        self._update_planes(camera)
+
+        objects = list(objects)
+        if not objects:
+            visible = []
+        else:
+            # Objects without bounds get NaN ones, which no test rejects.
+            bounds = [obj.world_bounds for obj in objects]
+            bounds = np.array([
+                b if b is not None else self.UNBOUNDED for b in bounds
+            ])
+            centers, extents, radii = (
+                bounds[:, 0:3], bounds[:, 3:6], bounds[:, 6]
+            )
+            distances = centers @ self._normals.T + self._offsets
+            box_radii = extents @ np.abs(self._normals).T
+            outside = (distances < -radii[:, None]) | (distances < -box_radii)
+            inside = ~outside.any(axis=1)
+            visible = [obj for obj, keep in zip(objects, inside) if keep]
+
+        self._drawn = len(visible)
+        self._culled = len(objects) - self._drawn
+        self._frames += 1
+        self._total_drawn += self._drawn
+        self._total_culled += self._culled
+        return visible
+
+    def report(self) -> str:
+        """
+        Returns a summary of the culling so far.
+
+        Returns:
+            str: The mean numbers of drawn and culled objects per frame.
+        """
+        frames = max(self._frames, 1)
+        return (
+            f"culling: {self._frames} frames, "
+            f"{self._total_drawn / frames:.1f} drawn and "
+            f"{self._total_culled / frames:.1f} culled per frame"
+        )
@@ -3,25 +3,55 @@ This file contains the main class for the graphics engine.
 """
 import logging
 import sys
+import time
 
 import moderngl as mgl
 
+from src import startup_trace
+from src.asset_loader import AssetLoader
 from src.camera import Camera
-from src.constants import OPENGL_CONSTANTS, GE_WIDGET_CONSTANTS
+from src.constants import (
+    OPENGL_CONSTANTS,
+    GE_WIDGET_CONSTANTS,
+    PROFILER_CONSTANTS,
+)
+from src.frame_pacer import FramePacer
+from src.frame_profiler import FrameProfiler
+from src.frame_uniforms import FrameUniforms
+from src.frustum_culler import FrustumCuller
+from src.instanced_renderer import InstancedRenderer
 from src.light import Light
+from src.lod_selector import LodSelector
+from src.scene import Scene
+from src.mesh_cache import MeshCache
+from src.shader_cache import ShaderProgramCache
+from src.texture_cache import TextureCache
 from src.objects.cube import Cube
 from src.objects.model_3d import Model3D
 
 from PyQt5 import QtOpenGL
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QKeyEvent, QMouseEvent
+from PyQt5.QtWidgets import QLabel
 
 
 class GraphicsEngine(QtOpenGL.QGLWidget):
     """
     Abstract class for the graphics engine.
+
+    Frames are rendered on demand: anything that changes the view calls
+    `request_render`, and one frame is scheduled no sooner than the frame
+    time of the target FPS after the previous one. While a key or mouse
+    button moves the camera or assets are still loading, every frame
+    requests the next one. A static scene renders nothing.
+
+    F3 toggles the frame profiler and its overlay, F4 dumps its samples.
+    While the overlay is shown it is refreshed, and a frame rendered, every
+    overlay interval, so its percentiles also fill on a static scene.
     """
 
+    rendered = pyqtSignal()
+
     def __init__(
         self, parent=None
     ) -> None:
@@ -44,8 +74,32 @@ class GraphicsEngine(QtOpenGL.QGLWidget):
         super(GraphicsEngine, self).__init__(fmt, None)
         self.setFocusPolicy(Qt.StrongFocus)
 
+        self._last_frame = 0.0
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.timeout.connect(self.update)
+
+        self._key_down_callbacks = {
+            Qt.Key_F3: self.toggle_profiler,
+            Qt.Key_F4: self.dump_profile,
+        }
+        self._init_overlay()
+
     # ====== INITIALIZATION ====== #
 
+    def _init_overlay(self) -> None:
+        """
+        Initializes the hidden overlay showing the profiler percentiles and
+        the timer refreshing it.
+        """
+        self._overlay = QLabel(self)
+        self._overlay.setStyleSheet(PROFILER_CONSTANTS.OVERLAY_STYLE)
+        self._overlay.move(8, 8)
+        self._overlay.hide()
+        self._overlay_timer = QTimer(self)
+        self._overlay_timer.setInterval(PROFILER_CONSTANTS.OVERLAY_INTERVAL_MS)
+        self._overlay_timer.timeout.connect(self._update_overlay)
+
     def _init_context(self) -> bool:
         """
         Initializes the moderngl context.
@@ -57,6 +111,10 @@ class GraphicsEngine(QtOpenGL.QGLWidget):
         try:
             self._mgl_context = mgl.create_context()
             self._mgl_context.enable(mgl.DEPTH_TEST | mgl.CULL_FACE)
+            self._shader_programs = ShaderProgramCache(self._mgl_context)
+            self._textures = TextureCache(self._mgl_context)
+            self._meshes = MeshCache(self._mgl_context)
+            self._asset_loader = AssetLoader(self)
         except mgl.Error as err:
             logging.error(f"Could not initialize moderngl: {err}")
             return False
@@ -71,15 +129,17 @@ class GraphicsEngine(QtOpenGL.QGLWidget):
 
     def _init_scene(self) -> None:
         """
-        Initializes the scene.
+        Initializes the scene. The assets of the objects are loaded in the
+        background.
         """
-        self._scene = [
+        self._scene = Scene([
             Cube(
                 self,
                 texture_path="src/textures/crate.png",
                 pos=(-2.5, 0, 0),
                 rot=(45, 0, 0),
                 scale=(1, 2, 1),
+                pre_render=False,
                 name="Cube 1"
             ),
             Cube(
@@ -88,6 +148,7 @@ class GraphicsEngine(QtOpenGL.QGLWidget):
                 pos=(2.5, 0, 0),
                 rot=(0, 0, -45),
                 scale=(1, 1, 2),
+                pre_render=False,
                 name="Cube 2"
             ),
             Model3D(
@@ -95,9 +156,13 @@ class GraphicsEngine(QtOpenGL.QGLWidget):
                 texture_path="src/models/cat/20430_cat_diff_v1.jpg",
                 object_path="src/models/cat/20430_Cat_v1_NEW.obj",
                 scale=(0.2, 0.2, 0.2),
+                pre_render=False,
                 name="Model3D 1"
             ),
-        ]
+        ])
+        for obj in self._scene:
+            self._asset_loader.load(obj)
+        self._scene.subscribe(lambda *_: self.request_render())
 
     def _init_light(self) -> None:
         """
@@ -105,6 +170,22 @@ class GraphicsEngine(QtOpenGL.QGLWidget):
         """
         self._light = Light(self)
 
+    def _init_renderer(self) -> None:
+        """
+        Initializes the per-frame uniform buffer, the frame pacer, the
+        frustum culler, the level of detail selector and the instanced
+        renderer.
+        """
+        self._frame_uniforms = FrameUniforms(self._mgl_context)
+        self._profiler = FrameProfiler(self._mgl_context)
+        self._frame_pacer = FramePacer(self._mgl_context)
+        self._culling = OPENGL_CONSTANTS.FRUSTUM_CULLING
+        self._culler = FrustumCuller()
+        self._lod_selection = OPENGL_CONSTANTS.LOD_SELECTION
+        self._lod_selector = LodSelector()
+        self._instanced = OPENGL_CONSTANTS.INSTANCED_RENDERING
+        self._instanced_renderer = InstancedRenderer(self)
+
     # ====== PROPERTIES ====== #
 
     @property
@@ -137,6 +218,161 @@ class GraphicsEngine(QtOpenGL.QGLWidget):
         """
         return self._mgl_context
 
+    @property
+    def shader_programs(self) -> ShaderProgramCache:
+        """
+        [READ-ONLY] Returns the shader program cache of the context.
+
+        Returns:
+            ShaderProgramCache: The shader program cache.
+        """
+        return self._shader_programs
+
+    @property
+    def textures(self) -> TextureCache:
+        """
+        [READ-ONLY] Returns the texture cache of the context.
+
+        Returns:
+            TextureCache: The texture cache.
+        """
+        return self._textures
+
+    @property
+    def meshes(self) -> MeshCache:
+        """
+        [READ-ONLY] Returns the mesh cache of the context.
+
+        Returns:
+            MeshCache: The mesh cache.
+        """
+        return self._meshes
+
+    @property
+    def asset_loader(self) -> AssetLoader:
+        """
+        [READ-ONLY] Returns the background asset loader of the context.
+
+        Returns:
+            AssetLoader: The asset loader.
+        """
+        return self._asset_loader
+
+    @property
+    def instanced(self) -> bool:
+        """
+        bool: Whether objects sharing a mesh are drawn in one instanced call.
+        """
+        return self._instanced
+
+    @instanced.setter
+    def instanced(self, instanced: bool) -> None:
+        """
+        Sets whether objects sharing a mesh are drawn in one instanced call.
+
+        Args:
+            instanced (bool): True for instanced drawing.
+        """
+        self._instanced = instanced
+
+    @property
+    def culling(self) -> bool:
+        """
+        bool: Whether objects outside of the view frustum are skipped.
+        """
+        return self._culling
+
+    @culling.setter
+    def culling(self, culling: bool) -> None:
+        """
+        Sets whether objects outside of the view frustum are skipped.
+
+        Args:
+            culling (bool): True for frustum culling.
+        """
+        self._culling = culling
+
+    @property
+    def culler(self) -> FrustumCuller:
+        """
+        [READ-ONLY] Returns the frustum culler, for its counts.
+
+        Returns:
+            FrustumCuller: The frustum culler.
+        """
+        return self._culler
+
+    @property
+    def frames_in_flight(self) -> int:
+        """
+        int: The number of frames the GPU may lag behind the CPU. 1 is the
+        low latency mode, up to `OPENGL_CONSTANTS.MAX_FRAMES_IN_FLIGHT`
+        favours throughput.
+        """
+        return self._frame_pacer.frames_in_flight
+
+    @frames_in_flight.setter
+    def frames_in_flight(self, frames_in_flight: int) -> None:
+        """
+        Sets the number of frames the GPU may lag behind the CPU.
+
+        Args:
+            frames_in_flight (int): The number of frames, clamped to the
+                supported range.
+        """
+        self._frame_pacer.frames_in_flight = frames_in_flight
+
+    @property
+    def lod_selection(self) -> bool:
+        """
+        bool: Whether distant objects are drawn with simplified geometry.
+        """
+        return self._lod_selection
+
+    @lod_selection.setter
+    def lod_selection(self, lod_selection: bool) -> None:
+        """
+        Sets whether distant objects are drawn with simplified geometry.
+        Turning it off draws every object at full detail again.
+
+        Args:
+            lod_selection (bool): True for level of detail selection.
+        """
+        self._lod_selection = lod_selection
+        if not lod_selection:
+            for obj in self._scene:
+                obj.lod = 0
+
+    @property
+    def lod_selector(self) -> LodSelector:
+        """
+        [READ-ONLY] Returns the level of detail selector, for its counts.
+
+        Returns:
+            LodSelector: The level of detail selector.
+        """
+        return self._lod_selector
+
+    @property
+    def profiler(self) -> FrameProfiler:
+        """
+        [READ-ONLY] Returns the frame profiler.
+
+        Returns:
+            FrameProfiler: The frame profiler.
+        """
+        return self._profiler
+
+    @property
+    def scene(self) -> Scene:
+        """
+        [READ-ONLY] Returns the scene.
+
+        Returns:
+            Scene: The scene.
+        """
+        return self._scene
+
     @property
     def camera(self) -> Camera:
         """
@@ -162,8 +398,47 @@ class GraphicsEngine(QtOpenGL.QGLWidget):
         Renders the scene.
         """
         self._mgl_context.clear(color=OPENGL_CONSTANTS.DEFAULT_SCENE_COLOUR)
-        for obj in self._scene:
-            obj.render()
+        objects = self._scene
+        with self._profiler.phase("cull"):
+            if self._culling:
+                objects = self._culler.cull(self._scene, self._camera)
+            if self._lod_selection:
+                self._lod_selector.select(objects, self._camera)
+
+        if self._instanced:
+            self._instanced_renderer.render(objects)
+        elif self._profiler.enabled:
+            with self._profiler.phase("draw"):
+                for obj in objects:
+                    with self._profiler.gpu(obj._name):
+                        obj.render()
+        else:
+            for obj in objects:
+                obj.render()
+
+    def _needs_next_frame(self) -> bool:
+        """
+        Checks whether the view keeps changing without further events: a
+        key is held, the mouse is dragged or assets are still loading.
+
+        Returns:
+            bool: True if another frame should follow this one.
+        """
+        return (
+            self._key_pressed is not None
+            or self._mouse_move != [0, 0]
+            or self._asset_loader.pending > 0
+        )
+
+    def _update_overlay(self) -> None:
+        """
+        Shows the latest profiler percentiles in the overlay and requests a
+        frame, so new samples keep coming and the GPU timings of earlier
+        frames get read.
+        """
+        self._overlay.setText(self._profiler.report())
+        self._overlay.adjustSize()
+        self.request_render()
 
     def _update_time(self) -> None:
         """
@@ -178,6 +453,11 @@ class GraphicsEngine(QtOpenGL.QGLWidget):
         """
         Handles the stop event.
         """
+        self._asset_loader.release()
+        self._instanced_renderer.release()
+        self._frame_uniforms.release()
+        self._profiler.release()
+        self._frame_pacer.release()
         for obj in self._scene:
             obj.destroy()
         sys.exit()
@@ -191,38 +471,99 @@ class GraphicsEngine(QtOpenGL.QGLWidget):
 
     # ====== PUBLIC METHODS ====== #
 
+    def request_render(self) -> None:
+        """
+        Marks the view as dirty. A frame is rendered once the frame time of
+        the target FPS has passed since the previous one; further requests
+        until then are merged into it.
+        """
+        if self._frame_timer.isActive():
+            return
+        elapsed = (time.perf_counter() - self._last_frame) * 1000
+        self._frame_timer.start(
+            max(0, int(GE_WIDGET_CONSTANTS.TIME_PER_TICK - elapsed))
+        )
+
+    def toggle_profiler(self) -> None:
+        """
+        Toggles the frame profiler and its overlay.
+        """
+        enabled = not self._profiler.enabled
+        self._profiler.enabled = enabled
+        self._overlay.setVisible(enabled)
+        if enabled:
+            self._overlay_timer.start()
+        else:
+            self._overlay_timer.stop()
+        self.request_render()
+
+    def dump_profile(
+        self, path: str = PROFILER_CONSTANTS.DUMP_FILE_NAME
+    ) -> None:
+        """
+        Writes the samples of the frame profiler, see `FrameProfiler.dump`.
+
+        Args:
+            path (str): The path of the file, JSON or CSV.
+        """
+        self._profiler.dump(path)
+        logging.info(f"Profile written to {path}")
+
     def initializeGL(self) -> None:
         """
         Initializes the graphics engine.
         """
-        if not (self._init_context()):
-            raise RuntimeError("Could not initialize.")
-        self._init_camera()
-        self._init_scene()
-        self._init_light()
+        with startup_trace.span("initializeGL"):
+            with startup_trace.span("context"):
+                if not (self._init_context()):
+                    raise RuntimeError("Could not initialize.")
+            self._init_camera()
+            with startup_trace.span("scene"):
+                self._init_scene()
+            self._init_light()
+            with startup_trace.span("renderer"):
+                self._init_renderer()
 
     def resizeGL(self, w, h) -> None:
         """
         Resizes the graphics engine.
         """
         self._mgl_context.viewport = (0, 0, self.width(), self.height())
+        if self.height() > 0:
+            self._camera.aspect_ratio = self.width() / self.height()
 
     def paintGL(self) -> None:
         """
-        Paints the graphics engine.
+        Paints the graphics engine, and requests the next frame while the
+        view keeps changing.
         """
+        profiler = self._profiler
+        self._last_frame = time.perf_counter()
+        profiler.begin_frame()
+        with profiler.phase("assets"):
+            self._asset_loader.poll()
         self._mgl_context.clear(color=OPENGL_CONSTANTS.DEFAULT_SCENE_COLOUR)
-        self._camera.update()
-        self._light.update()
+        with profiler.phase("camera_light"):
+            self._camera.update()
+            self._light.update()
+        with profiler.phase("uniforms"):
+            self._frame_uniforms.update(self._camera, self._light)
         self._render()
         self._update_time()
-        self._mgl_context.finish()
+        with profiler.phase("pacing"):
+            self._frame_pacer.end_frame()
+        profiler.end_frame()
+        if self._needs_next_frame():
+            self.request_render()
+        self.rendered.emit()
 
     def keyPressEvent(self, event: QKeyEvent):
         """
         Handles the key press event.
         """
         self._key_pressed = event.key()
+        self._handle_key_down(event.key())
+        self.request_render()
 
     def keyReleaseEvent(self, _: QKeyEvent) -> None:
         """
@@ -243,6 +584,7 @@ class GraphicsEngine(QtOpenGL.QGLWidget):
         """
         self._mouse_move[0] = self._mouse[0] - event.x()
         self._mouse_move[1] = self._mouse[1] - event.y()
+        self.request_render()
 
     def mouseReleaseEvent(self, _: QMouseEvent) -> None:
         """
@@ -0,0 +1,500 @@
+"""
+This file contains the headless graphics engine, which renders into an
+offscreen framebuffer without a Qt window.
+"""
+import logging
+from typing import Iterator
+
+import moderngl as mgl
+import numpy as np
+
+from src.animation import KeyFrameTimeline
+from src.asset_loader import AssetLoader
+from src.camera import Camera
+from src.constants import (
+    OPENGL_CONSTANTS,
+    EXPORT_CONSTANTS,
+    HEADLESS_CONSTANTS,
+    GUI_ANIMATION_WIDGET_CONSTANTS,
+)
+from src.frame_reader import FrameReader
+from src.frame_profiler import FrameProfiler
+from src.frame_uniforms import FrameUniforms
+from src.frustum_culler import FrustumCuller
+from src.instanced_renderer import InstancedRenderer
+from src.light import Light
+from src.lod_selector import LodSelector
+from src.scene import Scene
+from src.mesh_cache import MeshCache
+from src.shader_cache import ShaderProgramCache
+from src.texture_cache import TextureCache
+from src.scene_io import load_scene
+from src.video_export import FrameEncoder
+
+
+class HeadlessEngine:
+    """
+    Class for the headless graphics engine.
+    """
+
+    def __init__(
+        self,
+        win_size: tuple[int, int] = (
+            HEADLESS_CONSTANTS.WIDTH,
+            HEADLESS_CONSTANTS.HEIGHT
+        ),
+        backend: str = None
+    ) -> None:
+        self._win_size = win_size
+        self._time = 0
+        self._key_pressed = None
+        self._mouse_move = [0, 0]
+        self._scene = Scene()
+
+        if not (self._init_context(backend)):
+            raise RuntimeError("Could not initialize.")
+        self._init_framebuffer()
+        self._init_camera()
+        self._init_light()
+        self._init_renderer()
+
+    # ====== INITIALIZATION ====== #
+
+    def _init_context(self, backend: str) -> bool:
+        """
+        Initializes the standalone moderngl context. Without an explicit
+        backend the default one is tried first, falling back to EGL so that
+        no X server is needed.
+
+        Args:
+            backend (str): The glcontext backend to use, or None.
+
+        Returns:
+            bool: True if the moderngl context was initialized successfully,
+            False otherwise.
+        """
+        backends = [backend] if backend else [
+            None, HEADLESS_CONSTANTS.EGL_BACKEND
+        ]
+        for candidate in backends:
+            kwargs = {"backend": candidate} if candidate else {}
+            try:
+                self._mgl_context = mgl.create_standalone_context(
+                    require=OPENGL_CONSTANTS.GL_CONTEXT_MAJOR_VERSION * 100
+                    + OPENGL_CONSTANTS.GL_CONTEXT_MINOR_VERSION * 10,
+                    **kwargs
+                )
+            except Exception as err:
+                logging.warning(
+                    f"Could not create {candidate or 'default'} context: {err}"
+                )
+                continue
+            self._mgl_context.enable(mgl.DEPTH_TEST | mgl.CULL_FACE)
+            self._shader_programs = ShaderProgramCache(self._mgl_context)
+            self._textures = TextureCache(self._mgl_context)
+            self._meshes = MeshCache(self._mgl_context)
+            self._asset_loader = AssetLoader(self)
+            return True
+
+        logging.error("Could not initialize moderngl.")
+        return False
+
+    def _init_framebuffer(self) -> None:
+        """
+        Initializes the offscreen framebuffer.
+        """
+        self._fbo = self._mgl_context.framebuffer(
+            color_attachments=[
+                self._mgl_context.renderbuffer(self._win_size, components=4)
+            ],
+            depth_attachment=self._mgl_context.depth_renderbuffer(
+                self._win_size
+            ),
+        )
+        self._fbo.use()
+
+    def _init_camera(self) -> None:
+        """
+        Initializes the camera.
+        """
+        self._camera = Camera(self)
+
+    def _init_light(self) -> None:
+        """
+        Initializes the light.
+        """
+        self._light = Light(self)
+
+    def _init_renderer(self) -> None:
+        """
+        Initializes the per-frame uniform buffer, the frame profiler, the
+        frustum culler, the level of detail selector and the instanced
+        renderer.
+        """
+        self._frame_uniforms = FrameUniforms(self._mgl_context)
+        self._profiler = FrameProfiler(self._mgl_context)
+        self._culling = OPENGL_CONSTANTS.FRUSTUM_CULLING
+        self._culler = FrustumCuller()
+        self._lod_selection = OPENGL_CONSTANTS.LOD_SELECTION
+        self._lod_selector = LodSelector()
+        self._instanced = OPENGL_CONSTANTS.INSTANCED_RENDERING
+        self._instanced_renderer = InstancedRenderer(self)
+
+    # ====== PROPERTIES ====== #
+
+    @property
+    def time(self) -> float:
+        """
+        [READ-ONLY] Returns the time since the last frame.
+
+        Returns:
+            float: The time since the last frame.
+        """
+        return self._time
+
+    @property
+    def win_size(self) -> tuple[int]:
+        """
+        [READ-ONLY] Returns the framebuffer size.
+
+        Returns:
+            tuple[int]: The framebuffer size.
+        """
+        return self._win_size
+
+    @property
+    def mgl_context(self) -> mgl.Context:
+        """
+        [READ-ONLY] Returns the moderngl context.
+
+        Returns:
+            mgl.Context: The moderngl context.
+        """
+        return self._mgl_context
+
+    @property
+    def framebuffer(self) -> mgl.Framebuffer:
+        """
+        [READ-ONLY] Returns the offscreen framebuffer.
+
+        Returns:
+            mgl.Framebuffer: The offscreen framebuffer.
+        """
+        return self._fbo
+
+    @property
+    def shader_programs(self) -> ShaderProgramCache:
+        """
+        [READ-ONLY] Returns the shader program cache of the context.
+
+        Returns:
+            ShaderProgramCache: The shader program cache.
+        """
+        return self._shader_programs
+
+    @property
+    def textures(self) -> TextureCache:
+        """
+        [READ-ONLY] Returns the texture cache of the context.
+
+        Returns:
+            TextureCache: The texture cache.
+        """
+        return self._textures
+
+    @property
+    def meshes(self) -> MeshCache:
+        """
+        [READ-ONLY] Returns the mesh cache of the context.
+
+        Returns:
+            MeshCache: The mesh cache.
+        """
+        return self._meshes
+
+    @property
+    def asset_loader(self) -> AssetLoader:
+        """
+        [READ-ONLY] Returns the background asset loader of the context.
+
+        Returns:
+            AssetLoader: The asset loader.
+        """
+        return self._asset_loader
+
+    @property
+    def instanced(self) -> bool:
+        """
+        bool: Whether objects sharing a mesh are drawn in one instanced call.
+        """
+        return self._instanced
+
+    @instanced.setter
+    def instanced(self, instanced: bool) -> None:
+        """
+        Sets whether objects sharing a mesh are drawn in one instanced call.
+
+        Args:
+            instanced (bool): True for instanced drawing.
+        """
+        self._instanced = instanced
+
+    @property
+    def culling(self) -> bool:
+        """
+        bool: Whether objects outside of the view frustum are skipped.
+        """
+        return self._culling
+
+    @culling.setter
+    def culling(self, culling: bool) -> None:
+        """
+        Sets whether objects outside of the view frustum are skipped.
+
+        Args:
+            culling (bool): True for frustum culling.
+        """
+        self._culling = culling
+
+    @property
+    def culler(self) -> FrustumCuller:
+        """
+        [READ-ONLY] Returns the frustum culler, for its counts.
+
+        Returns:
+            FrustumCuller: The frustum culler.
+        """
+        return self._culler
+
+    @property
+    def lod_selection(self) -> bool:
+        """
+        bool: Whether distant objects are drawn with simplified geometry.
+        """
+        return self._lod_selection
+
+    @lod_selection.setter
+    def lod_selection(self, lod_selection: bool) -> None:
+        """
+        Sets whether distant objects are drawn with simplified geometry.
+        Turning it off draws every object at full detail again.
+
+        Args:
+            lod_selection (bool): True for level of detail selection.
+        """
+        self._lod_selection = lod_selection
+        if not lod_selection:
+            for obj in self._scene:
+                obj.lod = 0
+
+    @property
+    def lod_selector(self) -> LodSelector:
+        """
+        [READ-ONLY] Returns the level of detail selector, for its counts.
+
+        Returns:
+            LodSelector: The level of detail selector.
+        """
+        return self._lod_selector
+
+    @property
+    def profiler(self) -> FrameProfiler:
+        """
+        [READ-ONLY] Returns the frame profiler.
+
+        Returns:
+            FrameProfiler: The frame profiler.
+        """
+        return self._profiler
+
+    @property
+    def scene(self) -> Scene:
+        """
+        [READ-ONLY] Returns the scene.
+
+        Returns:
+            Scene: The scene.
+        """
+        return self._scene
+
+    @property
+    def camera(self) -> Camera:
+        """
+        [READ-ONLY] Returns the camera.
+
+        Returns:
+            Camera: The camera.
+        """
+        return self._camera
+
+    @property
+    def light(self) -> Light:
+        """
+        [READ-ONLY] Returns the light.
+
+        Returns:
+            Light: The light.
+        """
+        return self._light
+
+    # ====== PRIVATE METHODS ====== #
+
+    def _render(self) -> None:
+        """
+        Renders the scene.
+        """
+        self._fbo.clear(color=OPENGL_CONSTANTS.DEFAULT_SCENE_COLOUR)
+        objects = self._scene
+        with self._profiler.phase("cull"):
+            if self._culling:
+                objects = self._culler.cull(self._scene, self._camera)
+            if self._lod_selection:
+                self._lod_selector.select(objects, self._camera)
+
+        if self._instanced:
+            self._instanced_renderer.render(objects)
+        elif self._profiler.enabled:
+            with self._profiler.phase("draw"):
+                for obj in objects:
+                    with self._profiler.gpu(obj._name):
+                        obj.render()
+        else:
+            for obj in objects:
+                obj.render()
+
+    # ====== PUBLIC METHODS ====== #
+
+    def load_scene(self, path: str) -> tuple[dict, tuple[int, int]]:
+        """
+        Loads a scene file, replacing the current scene, and moves the
+        camera and light to the saved view. The assets of the objects are
+        decoded in parallel.
+
+        Args:
+            path (str): The path of the scene file.
+
+        Returns:
+            tuple: The key frames by object name and the first and last
+            frame of the animation.
+        """
+        for obj in self._scene:
+            obj.destroy()
+        objects, key_frames, frames = load_scene(
+            path, self, pre_render=False,
+            camera=self._camera, light=self._light
+        )
+        self._scene = Scene(objects)
+        for obj in self._scene:
+            self._asset_loader.load(obj)
+        self._asset_loader.wait()
+        return key_frames, frames
+
+    def render_frame(self) -> None:
+        """
+        Renders a single frame into the offscreen framebuffer.
+        """
+        self._fbo.use()
+        with self._profiler.phase("camera_light"):
+            self._camera.update()
+            self._light.update()
+        with self._profiler.phase("uniforms"):
+            self._frame_uniforms.update(self._camera, self._light)
+        self._render()
+
+    def read_frame(self) -> np.ndarray:
+        """
+        Reads the last rendered frame.
+
+        Returns:
+            np.ndarray: The frame as a top-down BGR image.
+        """
+        width, height = self._win_size
+        data = self._fbo.read(components=3)
+        img = np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3)
+        return np.ascontiguousarray(img[::-1, :, ::-1])
+
+    def render_frames(
+        self,
+        key_frames: dict[str, dict[int, tuple]],
+        frames: tuple[int, int],
+        pool_size: int = None
+    ) -> Iterator[np.ndarray]:
+        """
+        Renders the given frames of the animation and reads them back. The
+        poses are evaluated for a chunk of frames at a time. Each frame is
+        profiled from its pose until the next frame starts, so the time the
+        consumer spends on a yielded frame is included.
+
+        Args:
+            key_frames (dict): The key frames by object name.
+            frames (tuple[int, int]): The first and last frame to render.
+            pool_size (int): The number of frames that must stay valid
+                after being yielded, see `FrameReader`.
+
+        Yields:
+            np.ndarray: The frames in order, as top-down BGR images.
+        """
+        profiler = self._profiler
+        timeline = KeyFrameTimeline(key_frames)
+        chunk_size = EXPORT_CONSTANTS.POSE_CHUNK_SIZE
+        reader = FrameReader(self._mgl_context, self._fbo, pool_size=pool_size)
+        try:
+            for start in range(frames[0], frames[1] + 1, chunk_size):
+                end = min(start + chunk_size, frames[1] + 1)
+                with profiler.phase("evaluate"):
+                    poses = timeline.evaluate(np.arange(start, end))
+                for pose in poses:
+                    profiler.begin_frame()
+                    with profiler.phase("animate"):
+                        timeline.apply(self._scene, pose)
+                    self.render_frame()
+                    with profiler.phase("readback"):
+                        frame = reader.read()
+                    if frame is not None:
+                        yield frame
+            profiler.end_frame()
+            yield from reader.flush()
+        finally:
+            profiler.end_frame()
+            reader.release()
+
+    def render_animation(
+        self,
+        key_frames: dict[str, dict[int, tuple]],
+        frames: tuple[int, int],
+        file_name: str = GUI_ANIMATION_WIDGET_CONSTANTS.OUTPUT_FILE_NAME,
+        fps: float = GUI_ANIMATION_WIDGET_CONSTANTS.OUTPUT_FPS
+    ) -> FrameEncoder:
+        """
+        Renders every frame of the animation to a video file.
+
+        Args:
+            key_frames (dict): The key frames by object name.
+            frames (tuple[int, int]): The first and last frame to render.
+            file_name (str): The name of the output file, without extension.
+            fps (float): The frame rate of the output file.
+
+        Returns:
+            FrameEncoder: The closed encoder, for its queue statistics.
+        """
+        encoder = FrameEncoder(self._win_size, file_name, fps)
+        pool_size = encoder.queue_size + 2
+        for frame in self.render_frames(key_frames, frames, pool_size):
+            with self._profiler.phase("encode"):
+                encoder.write(frame)
+        encoder.close()
+        return encoder
+
+    def destroy(self) -> None:
+        """
+        Releases the scene and the context.
+        """
+        self._asset_loader.release()
+        self._instanced_renderer.release()
+        self._frame_uniforms.release()
+        self._profiler.release()
+        for obj in self._scene:
+            obj.destroy()
+        self._scene.clear()
+        self._fbo.release()
+        self._mgl_context.release()
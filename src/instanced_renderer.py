@@ -0,0 +1,212 @@
+"""
+This file contains the InstancedRenderer class.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.graphics_engine import GraphicsEngine
+    from src.objects.opengl_object import OpenGLObject
+
+import os
+
+import moderngl as mgl
+
+from src.constants import OPENGL_CONSTANTS
+
+
+class InstancedRenderer:
+    """
+    Class for drawing many copies of a mesh with a single draw call.
+
+    Objects that share a mesh and level of detail, shader and texture form
+    a batch. The model and normal matrices of a batch are packed into a
+    per-instance buffer and the batch is drawn with the instanced variant
+    of its shader. The buffer is only rewritten when the members of the
+    batch or their transforms changed.
+    """
+
+    def __init__(self, app: GraphicsEngine) -> None:
+        self._app = app
+        self._mgl_context = app.mgl_context
+        self._programs = {}
+        self._batches = {}
+
+    # ====== PRIVATE METHODS ====== #
+
+    def _get_program(self, shader_name: str) -> mgl.Program:
+        """
+        Returns the instanced variant of the shader program.
+
+        Args:
+            shader_name (str): The name of the shader program.
+
+        Returns:
+            mgl.Program: The instanced shader program.
+        """
+        if shader_name not in self._programs:
+            self._programs[shader_name] = self._app.shader_programs.acquire(
+                shader_name + OPENGL_CONSTANTS.INSTANCED_SHADER_SUFFIX,
+                shader_name
+            )
+        return self._programs[shader_name]
+
+    def _get_batch(self, key: tuple, obj: OpenGLObject) -> dict:
+        """
+        Returns the vertex array and instance buffer of a batch, rebuilding
+        them when the mesh of the batch was replaced.
+
+        Args:
+            key (tuple): The key of the batch.
+            obj (OpenGLObject): An object of the batch.
+
+        Returns:
+            dict: The batch.
+        """
+        batch = self._batches.get(key)
+        if batch is not None and batch["vbo"] is obj._vbo:
+            return batch
+        if batch is not None:
+            self._release_batch(batch)
+
+        instance_buffer = self._mgl_context.buffer(reserve=64)
+        vao = self._mgl_context.vertex_array(
+            self._get_program(obj._shader_name),
+            [
+                obj.vertex_format,
+                (instance_buffer, "16f 9f/i", "in_m_model", "in_m_normal"),
+            ],
+            index_buffer=obj._ibo,
+            index_element_size=4,
+        )
+        batch = {
+            "vbo": obj._vbo,
+            "vao": vao,
+            "instance_buffer": instance_buffer,
+            "program": self._get_program(obj._shader_name),
+            "name": f"batch {self._get_batch_name(obj)}",
+            "state": None,
+        }
+        self._batches[key] = batch
+        return batch
+
+    @staticmethod
+    def _get_batch_name(obj: OpenGLObject) -> str:
+        """
+        Returns a name for the batch of an object that does not depend on
+        which of its members comes first, e.g. for profiling.
+
+        Args:
+            obj (OpenGLObject): An object of the batch.
+
+        Returns:
+            str: The shader, mesh, level of detail and texture of the batch.
+        """
+        object_path = getattr(obj, "_object_path", None)
+        mesh = os.path.basename(object_path or type(obj).__name__)
+        texture = os.path.basename(obj._texture_path or "untextured")
+        return f"{obj._shader_name} {mesh} lod{obj.lod} {texture}"
+
+    @staticmethod
+    def _release_batch(batch: dict) -> None:
+        """
+        Releases the vertex array and instance buffer of a batch.
+
+        Args:
+            batch (dict): The batch.
+        """
+        batch["vao"].release()
+        batch["instance_buffer"].release()
+
+    def _write_shader(self, program: mgl.Program, texture: mgl.Texture):
+        """
+        Writes the per-batch uniforms to the shader program. The camera and
+        the light come from the per-frame uniform buffer.
+
+        Args:
+            program (mgl.Program): The instanced shader program.
+            texture (mgl.Texture): The texture of the batch.
+        """
+        if texture is not None:
+            program["u_texture_0"] = 0
+            texture.use()
+
+    def _update_batches(self, objects: list[OpenGLObject]) -> dict:
+        """
+        Groups the objects into batches and rewrites the instance buffers
+        of the batches that changed.
+
+        Args:
+            objects (list[OpenGLObject]): The objects to render.
+
+        Returns:
+            dict: The source object, texture and members of every batch, by
+            batch key.
+        """
+        groups = {}
+        for obj in objects:
+            source = obj
+            if obj.loading:
+                source = self._app.asset_loader.placeholder
+            elif not obj._pre_rendered:
+                obj._pre_render()
+            texture = source._texture
+            key = (
+                source._lod_key,
+                source._shader_name,
+                texture.glo if texture is not None else None,
+            )
+            group = groups.get(key)
+            if group is None:
+                groups[key] = group = (source, texture, [])
+            group[2].append(obj)
+
+        for key in list(self._batches):
+            if key not in groups:
+                self._release_batch(self._batches.pop(key))
+
+        for key, (source, texture, members) in groups.items():
+            batch = self._get_batch(key, source)
+            state = [(obj, obj.transform_version) for obj in members]
+            if batch["state"] != state:
+                data = b"".join(
+                    obj.m_model.to_bytes() + obj.m_normal.to_bytes()
+                    for obj in members
+                )
+                if batch["instance_buffer"].size < len(data):
+                    batch["instance_buffer"].orphan(len(data))
+                batch["instance_buffer"].write(data)
+                batch["state"] = state
+        return groups
+
+    # ====== PUBLIC METHODS ====== #
+
+    def render(self, objects: list[OpenGLObject]) -> None:
+        """
+        Renders the objects, one draw call per batch. Objects that are still
+        loading are drawn as instances of the placeholder.
+
+        Args:
+            objects (list[OpenGLObject]): The objects to render.
+        """
+        profiler = self._app.profiler
+        with profiler.phase("transforms"):
+            groups = self._update_batches(objects)
+
+        with profiler.phase("draw"):
+            for key, (source, texture, members) in groups.items():
+                batch = self._batches[key]
+                self._write_shader(batch["program"], texture)
+                with profiler.gpu(batch["name"]):
+                    batch["vao"].render(instances=len(members))
+
+    def release(self) -> None:
+        """
+        Releases the batches and the instanced shader programs.
+        """
+        for batch in self._batches.values():
+            self._release_batch(batch)
+        self._batches = {}
+        for program in self._programs.values():
+            self._app.shader_programs.release(program)
+        self._programs = {}
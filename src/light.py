@@ -3,7 +3,7 @@ This file contains the Light class.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 if TYPE_CHECKING:
     from src.graphics_engine import GraphicsEngine
@@ -14,14 +14,21 @@ from PyQt5.QtCore import Qt
 from src.constants import LIGHT_CONSTANTS
 
 
+LightListener = Callable[[str, "Light"], None]
+
+
 class Light:
     """
     Class for a light abstraction.
+
+    Listeners are notified with the name of the changed property and the
+    light whenever the position changes.
     """
 
     def __init__(self, app: GraphicsEngine) -> None:
         self._app = app
-        self._position = LIGHT_CONSTANTS.DEFAULT_LIGHT_POSITION
+        self._listeners = []
+        self._position = glm.vec3(LIGHT_CONSTANTS.DEFAULT_LIGHT_POSITION)
         self._color = LIGHT_CONSTANTS.DEFAULT_LIGHT_COLOR
         self._ambient = LIGHT_CONSTANTS.DEFAULT_LIGHT_AMBIENT * self._color
         self._diffuse = LIGHT_CONSTANTS.DEFAULT_LIGHT_DIFFUSE * self._color
@@ -30,13 +37,24 @@ class Light:
     @property
     def position(self) -> glm.vec3:
         """
-        [READ-ONLY] Returns the position of the light.
+        Returns the position of the light.
 
         Returns:
             glm.vec3: The position of the light.
         """
         return self._position
 
+    @position.setter
+    def position(self, position: glm.vec3) -> None:
+        """
+        Sets the position of the light.
+
+        Args:
+            position (glm.vec3): The position.
+        """
+        self._position = glm.vec3(position)
+        self._notify("position")
+
     @property
     def color(self) -> glm.vec3:
         """
@@ -77,9 +95,22 @@ class Light:
         """
         return self._specular
 
-    def _move(self) -> None:
+    def _notify(self, property_name: str) -> None:
+        """
+        Notifies the listeners of a change.
+
+        Args:
+            property_name (str): The name of the changed property.
+        """
+        for listener in list(self._listeners):
+            listener(property_name, self)
+
+    def _move(self) -> bool:
         """
         Moves the light.
+
+        Returns:
+            bool: True if the light moved.
         """
         step = LIGHT_CONSTANTS.DEFAULT_LIGHT_STEP
         key = self._app._key_pressed
@@ -95,9 +126,46 @@ class Light:
             self._position[2] += step
         elif key == Qt.Key_6:
             self._position[2] -= step
+        else:
+            return False
+        return True
+
+    def set_position_component(self, index: int, value: float) -> None:
+        """
+        Sets one component of the position in place. Unchanged values are
+        ignored.
+
+        Args:
+            index (int): The component, 0 to 2 for x, y and z.
+            value (float): The value.
+        """
+        if self._position[index] == value:
+            return
+        self._position[index] = value
+        self._notify("position")
+
+    def subscribe(self, listener: LightListener) -> None:
+        """
+        Registers a listener for changes of the light.
+
+        Args:
+            listener (Callable): Called with the property name and the light.
+        """
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: LightListener) -> None:
+        """
+        Unregisters a listener.
+
+        Args:
+            listener (Callable): The listener.
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
 
     def update(self) -> None:
         """
         Updates the light.
         """
-        self._move()
+        if self._move():
+            self._notify("position")
@@ -0,0 +1,85 @@
+"""
+This file contains the LodSelector class.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from src.camera import Camera
+    from src.objects.opengl_object import OpenGLObject
+
+import numpy as np
+
+from src.constants import CAMERA_CONSTANTS, MESH_CONSTANTS
+
+
+class LodSelector:
+    """
+    Class for picking the level of detail of every object from its size on
+    screen.
+
+    The screen size of an object is the diameter of its bounding sphere as
+    a fraction of the viewport height. An object uses level `n` once its
+    size falls below the `n`-th of the screen size thresholds. To keep
+    objects near a threshold from switching back and forth, a coarser level
+    is only picked once the size is below the threshold by the hysteresis
+    fraction, and a finer one once it is above it by the same fraction.
+    """
+
+    def __init__(
+        self,
+        screen_sizes: tuple[float] = MESH_CONSTANTS.LOD_SCREEN_SIZES,
+        hysteresis: float = MESH_CONSTANTS.LOD_HYSTERESIS
+    ) -> None:
+        thresholds = np.array(screen_sizes, dtype="f8")
+        self._coarser = thresholds * (1 - hysteresis)
+        self._finer = thresholds * (1 + hysteresis)
+        self._scale = 1 / np.tan(
+            np.radians(CAMERA_CONSTANTS.DEFAULT_CAMERA_FOV) / 2
+        )
+        self._counts = np.zeros(len(thresholds) + 1, dtype=np.int64)
+
+    # ====== PROPERTIES ====== #
+
+    @property
+    def counts(self) -> list[int]:
+        """
+        [READ-ONLY] list[int]: The number of objects with levels of detail
+        drawn at each level in the last frame.
+        """
+        return self._counts.tolist()
+
+    # ====== PUBLIC METHODS ====== #
+
+    def select(
+        self, objects: Iterable[OpenGLObject], camera: Camera
+    ) -> None:
+        """
+        Updates the level of detail of the objects.
+
+        Args:
+            objects (Iterable[OpenGLObject]): The objects to draw.
+            camera (Camera): The camera.
+        """
+        objects = [
+            obj for obj in objects
+            if obj.lod_count > 1 and obj.world_bounds is not None
+        ]
+        self._counts[:] = 0
+        if not objects:
+            return
+
+        bounds = np.array([obj.world_bounds for obj in objects])
+        distances = np.linalg.norm(
+            bounds[:, 0:3] - np.array(camera.position), axis=1
+        )
+        sizes = np.divide(
+            bounds[:, 6] * self._scale, distances,
+            out=np.full(len(objects), np.inf), where=distances > 0
+        )
+        finest = (sizes[:, None] < self._coarser).sum(axis=1)
+        coarsest = (sizes[:, None] < self._finer).sum(axis=1)
+
+        for obj, low, high in zip(objects, finest.tolist(), coarsest.tolist()):
+            obj.lod = min(max(obj.lod, low), high)
+            self._counts[obj.lod] += 1
@@ -0,0 +1,104 @@
+"""
+This file contains the MeshCache class.
+"""
+from typing import Callable, Union
+
+import moderngl as mgl
+import numpy as np
+
+
+MeshResource = Union[mgl.Buffer, mgl.VertexArray]
+
+
+class MeshCache:
+    """
+    Class for sharing geometry within a moderngl context.
+
+    Vertex buffers are keyed by the geometry source of an object and vertex
+    arrays additionally by the shader program they bind, so every object
+    with the same geometry reuses one upload. Both are reference counted and
+    released when their last user releases them. The metadata of each
+    geometry, its bounds and number of levels of detail, is small and kept
+    for the lifetime of the cache.
+    """
+
+    def __init__(self, ctx: mgl.Context) -> None:
+        self._ctx = ctx
+        self._resources = {}
+        self._ref_counts = {}
+        self._keys = {}
+        self._metadata = {}
+
+    # ====== PUBLIC METHODS ====== #
+
+    def acquire(
+        self, key: tuple, create: Callable[[], MeshResource]
+    ) -> MeshResource:
+        """
+        Returns the resource stored under the key, creating it on first use.
+
+        Args:
+            key (tuple): The key of the resource.
+            create (Callable): Creates the resource when it is missing.
+
+        Returns:
+            mgl.Buffer | mgl.VertexArray: The shared resource.
+        """
+        if key not in self._resources:
+            resource = create()
+            self._resources[key] = resource
+            self._ref_counts[key] = 0
+            self._keys[id(resource)] = key
+
+        self._ref_counts[key] += 1
+        return self._resources[key]
+
+    def release(self, resource: MeshResource) -> None:
+        """
+        Drops one reference to the resource, releasing it when no users are
+        left.
+
+        Args:
+            resource (mgl.Buffer | mgl.VertexArray): The resource.
+        """
+        key = self._keys.get(id(resource))
+        if key is None:
+            return
+
+        self._ref_counts[key] -= 1
+        if self._ref_counts[key] == 0:
+            del self._resources[key]
+            del self._ref_counts[key]
+            del self._keys[id(resource)]
+            resource.release()
+
+    def get_metadata(
+        self, key: tuple, compute: Callable[[], tuple[np.ndarray, int]]
+    ) -> tuple[np.ndarray, int]:
+        """
+        Returns the metadata of the geometry stored under the key, computing
+        it on first use.
+
+        Args:
+            key (tuple): The key of the geometry.
+            compute (Callable): Computes the metadata when it is missing.
+
+        Returns:
+            tuple[np.ndarray, int]: The bounds, see
+            `OpenGLObject.get_bounds`, and the number of levels of detail.
+        """
+        if key not in self._metadata:
+            self._metadata[key] = compute()
+        return self._metadata[key]
+
+    def ref_count(self, key: tuple) -> int:
+        """
+        Returns the number of users of the resource stored under the key.
+
+        Args:
+            key (tuple): The key of the resource.
+
+        Returns:
+            int: The number of users.
+        """
+        return self._ref_counts.get(key, 0)
@@ -0,0 +1,213 @@
+"""
+This file contains the baked mesh format used to cache parsed Wavefront
+models next to their source.
+
+A baked mesh is a fixed size header followed by the raw interleaved
+T2F_N3F_V3F unique vertices as little endian float32 and the triangle
+indices into them as little endian uint32. The header holds the vertex and
+index counts, the bounds of the positions and the size, modification time
+and hash of the source the mesh was baked from. The data is memory mapped
+on load, so it goes to the GPU without temporary Python objects.
+
+The simplified levels of detail of a model are baked the same way, to files
+named after the grid size they were simplified with.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import struct
+import threading
+
+import numpy as np
+
+from src.constants import MESH_CONSTANTS
+
+
+HEADER_FORMAT = "<8sIIIIQq32s6f"
+HEADER_SIZE = 128
+
+
+def get_source_path(object_path: str) -> str:
+    """
+    Returns the file the model is parsed from: the object file, or the
+    pywavefront cache when only the cache is shipped.
+
+    :param object_path: The path to the object file.
+    """
+    if os.path.exists(object_path):
+        return object_path
+    return object_path + ".bin"
+
+
+def get_baked_path(object_path: str, lod: int = None) -> str:
+    """
+    Returns the path of the baked mesh of the model.
+
+    :param object_path: The path to the object file.
+    :param lod: The grid size of a simplified level of detail, or None for
+        the full mesh.
+    """
+    if lod is not None:
+        object_path = f"{object_path}.lod{lod}"
+    return object_path + MESH_CONSTANTS.BAKED_MESH_EXTENSION
+
+
+def _hash_file(path: str) -> bytes:
+    """
+    Returns the SHA-256 digest of the file.
+
+    :param path: The path to the file.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _read_header(baked_path: str) -> tuple | None:
+    """
+    Reads the header of a baked mesh.
+
+    :param baked_path: The path of the baked mesh.
+
+    Returns:
+        tuple | None: The header fields, or None if the file is missing or
+        not a baked mesh of the current version.
+    """
+    try:
+        with open(baked_path, "rb") as f:
+            header = f.read(HEADER_SIZE)
+    except OSError:
+        return None
+
+    if len(header) < struct.calcsize(HEADER_FORMAT):
+        return None
+    fields = struct.unpack_from(HEADER_FORMAT, header)
+    magic, version = fields[0], fields[1]
+    if magic != MESH_CONSTANTS.BAKED_MESH_MAGIC:
+        return None
+    if version != MESH_CONSTANTS.BAKED_MESH_VERSION:
+        return None
+    return fields
+
+
+def _is_valid(fields: tuple, source_path: str) -> bool:
+    """
+    Checks whether a baked mesh was baked from the current source. A
+    matching size and modification time is trusted; otherwise the source
+    is hashed, so touched but unchanged sources keep their bake.
+
+    :param fields: The header fields of the baked mesh.
+    :param source_path: The path of the source.
+    """
+    _, _, _, _, _, size, mtime, digest = fields[:8]
+    stat = os.stat(source_path)
+    if stat.st_size == size and stat.st_mtime_ns == mtime:
+        return True
+    return stat.st_size == size and _hash_file(source_path) == digest
+
+
+def bake_mesh(
+        object_path: str,
+        vertex_data: np.ndarray,
+        index_data: np.ndarray,
+        lod: int = None,
+        ) -> None:
+    """
+    Writes the baked mesh of the model.
+
+    :param object_path: The path to the object file.
+    :param vertex_data: The interleaved T2F_N3F_V3F unique vertices.
+    :param index_data: The triangle indices into the vertices.
+    :param lod: The grid size of a simplified level of detail, or None for
+        the full mesh.
+    """
+    source_path = get_source_path(object_path)
+    stat = os.stat(source_path)
+    vertex_data = np.ascontiguousarray(vertex_data, dtype="<f4").reshape(
+        -1, MESH_CONSTANTS.FLOATS_PER_VERTEX
+    )
+    index_data = np.ascontiguousarray(index_data, dtype="<u4").reshape(-1)
+    positions = vertex_data[:, 5:8]
+    bounds = (*positions.min(axis=0), *positions.max(axis=0))
+
+    header = struct.pack(
+        HEADER_FORMAT,
+        MESH_CONSTANTS.BAKED_MESH_MAGIC,
+        MESH_CONSTANTS.BAKED_MESH_VERSION,
+        len(vertex_data),
+        MESH_CONSTANTS.FLOATS_PER_VERTEX,
+        len(index_data),
+        stat.st_size,
+        stat.st_mtime_ns,
+        _hash_file(source_path),
+        *bounds,
+    )
+    baked_path = get_baked_path(object_path, lod)
+    tmp_path = f"{baked_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header.ljust(HEADER_SIZE, b"\0"))
+        vertex_data.tofile(f)
+        index_data.tofile(f)
+    os.replace(tmp_path, baked_path)
+
+
+def load_baked_mesh(
+        object_path: str,
+        lod: int = None
+        ) -> tuple[np.memmap, np.memmap] | None:
+    """
+    Memory maps the baked mesh of the model if it is up to date.
+
+    :param object_path: The path to the object file.
+    :param lod: The grid size of a simplified level of detail, or None for
+        the full mesh.
+
+    Returns:
+        tuple | None: The vertex data, one row per vertex, and the index
+        data, or None if there is no valid baked mesh.
+    """
+    baked_path = get_baked_path(object_path, lod)
+    fields = _read_header(baked_path)
+    source_path = get_source_path(object_path)
+    if fields is None or not os.path.exists(source_path):
+        return None
+    if not _is_valid(fields, source_path):
+        logging.info(f"Baked mesh {baked_path} is stale")
+        return None
+
+    vertex_count, floats_per_vertex, index_count = fields[2:5]
+    vertex_data = np.memmap(
+        baked_path,
+        dtype="<f4",
+        mode="r",
+        offset=HEADER_SIZE,
+        shape=(vertex_count, floats_per_vertex),
+    )
+    index_data = np.memmap(
+        baked_path,
+        dtype="<u4",
+        mode="r",
+        offset=HEADER_SIZE + vertex_data.nbytes,
+        shape=(index_count,),
+    )
+    return vertex_data, index_data
+
+
+def load_bounds(object_path: str) -> tuple[tuple, tuple] | None:
+    """
+    Returns the bounds stored in the baked mesh of the model.
+
+    :param object_path: The path to the object file.
+
+    Returns:
+        tuple | None: The minimum and maximum corner of the positions, or
+        None if there is no baked mesh.
+    """
+    fields = _read_header(get_baked_path(object_path))
+    if fields is None:
+        return None
+    return tuple(fields[8:11]), tuple(fields[11:14])
@@ -0,0 +1,73 @@
+"""
+This file contains the mesh simplification used to build the levels of
+detail of high-poly models.
+
+Meshes are simplified by vertex clustering: the bounding box of the mesh is
+split into a uniform grid, all vertices in a grid cell are merged into one
+vertex at their mean, and triangles that collapse or repeat after the merge
+are dropped. It is a single vectorized pass over the indexed mesh, so it
+runs at import time without a mesh processing library, at the cost of
+smearing seams that a quadric error decimation would keep. The coarse
+levels are only drawn where that is too small to see.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from src.constants import MESH_CONSTANTS
+
+
+def simplify_mesh(
+        vertex_data: np.ndarray,
+        index_data: np.ndarray,
+        grid_size: int
+        ) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns a simplified copy of an indexed mesh.
+
+    :param vertex_data: The unique vertices, one row per vertex with the
+        position in the last three columns.
+    :param index_data: The triangle indices into the vertices.
+    :param grid_size: The number of grid cells along the longest side of
+        the bounding box.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The merged vertices and the triangle
+        indices into them.
+    """
+    vertex_data = np.asarray(vertex_data, dtype="f4")
+    positions = vertex_data[:, -3:].astype("f8")
+    minimum = positions.min(axis=0)
+    cell_size = (positions.max(axis=0) - minimum).max() / grid_size
+    if cell_size <= 0:
+        return vertex_data, np.asarray(index_data, dtype="u4")
+
+    cells = np.floor((positions - minimum) / cell_size).astype(np.int64)
+    cells = np.minimum(cells, grid_size)
+    dims = grid_size + 1
+    cell_ids = (cells[:, 0] * dims + cells[:, 1]) * dims + cells[:, 2]
+    _, cluster_of, counts = np.unique(
+        cell_ids, return_inverse=True, return_counts=True
+    )
+    cluster_of = cluster_of.reshape(-1)
+
+    order = np.argsort(cluster_of, kind="stable")
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    merged = np.add.reduceat(
+        vertex_data[order].astype("f8"), starts, axis=0
+    ) / counts[:, None]
+    if vertex_data.shape[1] == MESH_CONSTANTS.FLOATS_PER_VERTEX:
+        normals = merged[:, 2:5]
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        np.divide(normals, lengths, out=normals, where=lengths > 0)
+
+    triangles = cluster_of[np.asarray(index_data).reshape(-1, 3)]
+    a, b, c = triangles.T
+    triangles = triangles[(a != b) & (b != c) & (a != c)]
+    _, first = np.unique(
+        np.sort(triangles, axis=1), axis=0, return_index=True
+    )
+    triangles = triangles[np.sort(first)]
+
+    used, remap = np.unique(triangles, return_inverse=True)
+    return merged[used].astype("f4"), remap.reshape(-1).astype("u4")
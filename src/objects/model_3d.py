@@ -7,11 +7,19 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from src.graphics_engine import GraphicsEngine
 
+import logging
+import os
+
 import numpy as np
-import pywavefront
 
+from src.objects.baked_mesh import (
+    bake_mesh,
+    get_source_path,
+    load_baked_mesh,
+)
+from src.objects.mesh_lod import simplify_mesh
 from src.objects.opengl_object import OpenGLObject
-from src.constants import OPENGL_CONSTANTS
+from src.constants import OPENGL_CONSTANTS, MESH_CONSTANTS
 
 
 class Model3D(OpenGLObject):
@@ -37,9 +45,91 @@ class Model3D(OpenGLObject):
             name
         )
 
-    def _get_vertex_data(self):
+    def _get_mesh_key(self) -> tuple:
+        """
+        Returns the key of the geometry of the Model3D, which identifies the
+        object file and its version on disk.
+
+        Returns:
+            tuple: The key of the geometry.
+        """
+        path = os.path.abspath(get_source_path(self._object_path))
+        mtime = os.stat(path).st_mtime_ns if os.path.exists(path) else None
+        return (type(self).__name__, path, mtime, self._texture_path is not None)
+
+    def _get_mesh_data(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the indexed geometry of the Model3D, memory mapped from its
+        baked mesh. The model is parsed, deduplicated and baked when the
+        bake is missing or stale.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The unique vertices and the
+            triangle indices into them.
+        """
+        mesh_data = load_baked_mesh(self._object_path)
+        if mesh_data is not None:
+            return mesh_data
+
+        mesh_data = self.get_indexed_data(self._get_vertex_data())
+        try:
+            bake_mesh(self._object_path, *mesh_data)
+        except OSError as err:
+            logging.warning(f"Could not bake {self._object_path}: {err}")
+            return mesh_data
+        # The bake is stale again if another process rewrote the source
+        # meanwhile; the parsed geometry is still valid then.
+        return load_baked_mesh(self._object_path) or mesh_data
+
+    def _get_lod_data(self) -> list[tuple[np.ndarray, np.ndarray]]:
+        """
+        Returns the levels of detail of the Model3D: the full geometry
+        followed by simplifications on ever coarser grids. Each level is
+        baked next to the object file. Levels that would not save enough
+        triangles over the previous one are left out.
+
+        Returns:
+            list[tuple[np.ndarray, np.ndarray]]: The indexed geometry of
+            every level, finest first.
+        """
+        lod_data = [self._get_mesh_data()]
+        for grid_size in MESH_CONSTANTS.LOD_GRID_SIZES:
+            mesh_data = load_baked_mesh(self._object_path, grid_size)
+            if mesh_data is None:
+                mesh_data = simplify_mesh(*lod_data[0], grid_size)
+            index_count = len(mesh_data[1])
+            if not index_count or index_count > (
+                len(lod_data[-1][1]) * MESH_CONSTANTS.LOD_MIN_REDUCTION
+            ):
+                break
+
+            if not isinstance(mesh_data[1], np.memmap):
+                try:
+                    bake_mesh(self._object_path, *mesh_data, grid_size)
+                except OSError as err:
+                    logging.warning(
+                        f"Could not bake {self._object_path}: {err}"
+                    )
+            lod_data.append(mesh_data)
+        return lod_data
+
+    def _get_vertex_data(self) -> np.ndarray:
+        """
+        Parses the object file with pywavefront.
+
+        Returns:
+            np.ndarray: The vertex data for the Model3D.
+        """
+        # Only needed for object files without a baked mesh.
+        import pywavefront
+
         objs = pywavefront.Wavefront(self._object_path, cache=True, parse=True)
         obj = objs.materials.popitem()[1]
+        if obj.vertex_format != MESH_CONSTANTS.VERTEX_FORMAT:
+            raise ValueError(
+                f"Unsupported vertex format {obj.vertex_format} in "
+                f"{self._object_path}, expected {MESH_CONSTANTS.VERTEX_FORMAT}"
+            )
         vertex_data = obj.vertices
         vertex_data = np.array(vertex_data, dtype="f4")
-        return vertex_data
+        return vertex_data.reshape(-1, MESH_CONSTANTS.FLOATS_PER_VERTEX)
@@ -2,7 +2,7 @@
 This file contains the abstract Object class.
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 if TYPE_CHECKING:
     from src.graphics_engine import GraphicsEngine
@@ -11,14 +11,19 @@ from abc import ABC, abstractmethod
 import numpy as np
 import moderngl as mgl
 import glm
-from PIL import Image
 
 from src.constants import OPENGL_CONSTANTS
 
 
+ObjectListener = Callable[[str, "OpenGLObject"], None]
+
+
 class OpenGLObject(ABC):
     """
     Class for an OpenGlObject.
+
+    Listeners are notified with the name of the changed property and the
+    object whenever the position, rotation or scale changes.
     """
 
     def __init__(
@@ -34,13 +39,24 @@ class OpenGLObject(ABC):
     ) -> None:
         self._app = app
         self._pos = pos
-        self._rot = glm.vec3([glm.radians(a) for a in rot])
+        self._rot = tuple(glm.radians(a) for a in rot)
         self._scale = scale
-        self._shader_program = shader_program
+        self._m_model = None
+        self._m_normal = None
+        self._transform_version = 0
+        self._bounds = None
+        self._world_bounds = None
+        self._shader_name = shader_program
         self._mgl_context = app.mgl_context
         self._shader_program = shader_program
-        self.texture = texture_path
+        self._texture = None
+        self._texture_path = texture_path
         self._name = name
+        self._pre_rendered = False
+        self._loading = False
+        self._listeners = []
+        self._lods = []
+        self._lod = 0
 
         if pre_render:
             self._pre_render()
@@ -68,57 +84,208 @@ class OpenGLObject(ABC):
         data = [vertices[ind] for triangle in indices for ind in triangle]
         return np.array(data, dtype=np.float32)
 
+    @staticmethod
+    def get_indexed_data(
+        vertex_data: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Deduplicates the vertices of an expanded triangle list.
+
+        Args:
+            vertex_data (np.ndarray): The vertex data, three vertices per
+                triangle.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The unique vertices, in order of
+            first use, and the triangle indices into them.
+        """
+        vertex_data = np.ascontiguousarray(vertex_data, dtype="f4")
+        rows = vertex_data.reshape(len(vertex_data), -1)
+        _, first, inverse = np.unique(
+            rows, axis=0, return_index=True, return_inverse=True
+        )
+        order = np.argsort(first)
+        remap = np.empty_like(order)
+        remap[order] = np.arange(len(order))
+        index_data = remap[inverse.reshape(-1)].astype("u4")
+        return rows[first[order]], index_data
+
+    @staticmethod
+    def get_bounds(vertex_data: np.ndarray) -> np.ndarray:
+        """
+        Returns the bounds of the geometry: its axis aligned bounding box
+        and the radius of its bounding sphere around the box center.
+
+        Args:
+            vertex_data (np.ndarray): The vertex data, one row per vertex
+                with the position in the last three columns.
+
+        Returns:
+            np.ndarray: The minimum corner, the maximum corner and the
+            radius, seven floats.
+        """
+        positions = np.asarray(vertex_data, dtype="f8")[:, -3:]
+        minimum = positions.min(axis=0)
+        maximum = positions.max(axis=0)
+        center = (minimum + maximum) / 2
+        radius = np.sqrt(((positions - center) ** 2).sum(axis=1).max())
+        return np.concatenate([minimum, maximum, [radius]])
+
     # ====== PRIVATE METHODS ====== #
 
-    def _pre_render(self) -> None:
+    def _get_mesh_key(self) -> tuple:
+        """
+        Returns the key of the geometry of the OpenGlObject. Objects with
+        equal keys share their vertex buffer and vertex array.
+
+        Returns:
+            tuple: The key of the geometry.
+        """
+        return (type(self).__name__, self._texture_path is not None)
+
+    def _get_mesh_data(self) -> tuple[np.ndarray, np.ndarray]:
         """
-        Pre-renders the OpenGlObject.
+        Returns the indexed geometry of the OpenGlObject.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The unique vertices and the
+            triangle indices into them.
         """
-        self._vbo = self._get_vbo()
-        self._shader_program = self._get_shader_program(self._shader_program)
-        self._vao = self._get_vao()
+        return self.get_indexed_data(self._get_vertex_data())
+
+    def _get_lod_data(self) -> list[tuple[np.ndarray, np.ndarray]]:
+        """
+        Returns the levels of detail of the OpenGlObject. Simple objects
+        only have their full geometry.
+
+        Returns:
+            list[tuple[np.ndarray, np.ndarray]]: The indexed geometry of
+            every level, finest first.
+        """
+        return [self._get_mesh_data()]
+
+    def _pre_render(
+        self, image: tuple = None, lod_data: list = None
+    ) -> None:
+        """
+        Pre-renders the OpenGlObject, uploading its texture and geometry.
+
+        Args:
+            image (tuple): The already decoded texture, see
+                `TextureCache.decode`.
+            lod_data (list): The already loaded levels of detail, see
+                `_get_lod_data`.
+        """
+        if self._texture_path is not None and self._texture is None:
+            self._texture = self._load_texture(self._texture_path, image)
+        self._shader_program = self._get_shader_program(self._shader_name)
+        self._mesh_key = self._get_mesh_key()
+        self._lods = self._get_lods(lod_data)
+        self._set_lod(min(self._lod, len(self._lods) - 1))
 
         self._pre_rendered = True
+        self._loading = False
 
-    def _get_vbo(self) -> mgl.Buffer:
+    def _get_lods(self, lod_data: list = None) -> list[tuple]:
         """
-        Returns the vertex buffer object for the OpenGlObject.
+        Returns the vertex buffer, index buffer and vertex array of every
+        level of detail of the OpenGlObject, shared with the other objects
+        of the context with the same geometry, and looks up the bounds of
+        the geometry.
+
+        Args:
+            lod_data (list): The already loaded levels of detail, if any.
 
         Returns:
-            mgl.Buffer: The vertex buffer object for the OpenGlObject.
+            list[tuple]: The buffers and vertex array of every level,
+            finest first.
+        """
+        meshes = self._app.meshes
+        if lod_data is None and not meshes.ref_count(
+            ("vbo", (self._mesh_key, 0))
+        ):
+            lod_data = self._get_lod_data()
+
+        self._bounds, lod_count = meshes.get_metadata(
+            self._mesh_key,
+            lambda: (self.get_bounds(lod_data[0][0]), len(lod_data))
+        )
+        self._world_bounds = None
+
+        lods = []
+        for level in range(lod_count):
+            key = (self._mesh_key, level)
+            vbo = meshes.acquire(
+                ("vbo", key),
+                lambda: self._mgl_context.buffer(lod_data[level][0])
+            )
+            ibo = meshes.acquire(
+                ("ibo", key),
+                lambda: self._mgl_context.buffer(lod_data[level][1])
+            )
+            vao = meshes.acquire(
+                ("vao", key, self._shader_program.glo),
+                lambda: self._create_vao(vbo, ibo)
+            )
+            lods.append((vbo, ibo, vao))
+        return lods
+
+    def _set_lod(self, level: int) -> None:
+        """
+        Switches the OpenGlObject to one of its levels of detail.
+
+        Args:
+            level (int): The level, 0 being the full geometry.
         """
-        return self._mgl_context.buffer(self._get_vertex_data())
+        self._lod = level
+        self._lod_key = (self._mesh_key, level)
+        self._vbo, self._ibo, self._vao = self._lods[level]
 
-    def _get_vao(self) -> mgl.VertexArray:
+    def _create_vao(
+        self, vbo: mgl.Buffer, ibo: mgl.Buffer
+    ) -> mgl.VertexArray:
         """
-        Returns the vertex array object for the OpenGlObject.
+        Creates a vertex array object for the OpenGlObject.
+
+        Args:
+            vbo (mgl.Buffer): The vertex buffer.
+            ibo (mgl.Buffer): The index buffer.
 
         Returns:
             mgl.VertexArray: The vertex array object for the OpenGlObject.
         """
-        if self._texture is not None:
-            vertex_array = self._mgl_context.vertex_array(
-                self._shader_program,
-                [
-                    (
-                        self._vbo,
-                        "2f 3f 3f",
-                        "in_texcoord_0",
-                        "in_normal",
-                        "in_position"
-                    )
-                ],
-            )
-        else:
-            vertex_array = self._mgl_context.vertex_array(
-                self._shader_program, [(self._vbo, "3f", "in_position")]
-            )
+        return self._mgl_context.vertex_array(
+            self._shader_program,
+            [self._get_vertex_format(vbo)],
+            index_buffer=ibo,
+            index_element_size=4
+        )
 
-        return vertex_array
+    def _get_vertex_format(self, vbo: mgl.Buffer) -> tuple:
+        """
+        Returns a vertex buffer of the OpenGlObject with its format and
+        attribute names, as used to build a vertex array.
+
+        Args:
+            vbo (mgl.Buffer): The vertex buffer.
+
+        Returns:
+            tuple: The buffer, its format and its attribute names.
+        """
+        if self._texture_path is not None:
+            return (
+                vbo,
+                "2f 3f 3f",
+                "in_texcoord_0",
+                "in_normal",
+                "in_position"
+            )
+        return (vbo, "3f", "in_position")
 
     def _get_shader_program(self, shader_name: str) -> mgl.Program:
         """
-        Returns the shader program for the OpenGlObject.
+        Returns the shader program for the OpenGlObject, shared with the
+        other objects of the context.
 
         Args:
             shader_name (str): The name of the shader program.
@@ -126,18 +293,27 @@ class OpenGLObject(ABC):
         Returns:
             mgl.Program: The shader program for the OpenGlObject.
         """
-        with open(f"src/shaders/{shader_name}.vert", "r") as f:
-            vertex_shader_source = f.read()
+        return self._app.shader_programs.acquire(shader_name)
 
-        with open(f"src/shaders/{shader_name}.frag", "r") as f:
-            fragment_shader_source = f.read()
+    def _invalidate_transform(self) -> None:
+        """
+        Marks the cached model and normal matrices and world bounds as
+        stale.
+        """
+        self._m_model = None
+        self._m_normal = None
+        self._world_bounds = None
+        self._transform_version += 1
 
-        program = self._mgl_context.program(
-            vertex_shader=vertex_shader_source,
-            fragment_shader=fragment_shader_source
-        )
+    def _notify(self, property_name: str) -> None:
+        """
+        Notifies the listeners of a change.
 
-        return program
+        Args:
+            property_name (str): The name of the changed property.
+        """
+        for listener in list(self._listeners):
+            listener(property_name, self)
 
     def _get_model_matrix(self) -> np.ndarray:
         """
@@ -193,14 +369,13 @@ class OpenGLObject(ABC):
 
     def _write_shader(self) -> None:
         """
-        Writes the pvm to the shader program.
+        Writes the model and normal matrices and the texture to the shader
+        program. The camera and the light come from the per-frame uniform
+        buffer.
         """
         self._write_texture()
-        self._write_lighing()
-
-        self._shader_program["m_proj"].write(self._app.camera.m_proj)
-        self._shader_program["m_view"].write(self._app.camera.m_view)
         self._shader_program["m_model"].write(self.m_model)
+        self._shader_program["m_normal"].write(self.m_normal)
 
     def _write_texture(self) -> None:
         """
@@ -210,44 +385,168 @@ class OpenGLObject(ABC):
             self._shader_program["u_texture_0"] = 0
             self._texture.use()
 
-    def _write_lighing(self) -> None:
-        """
-        Writes the lighting to the shader program.
-        """
-        self._shader_program["light.position"].write(self._app.light.position)
-        self._shader_program["light.Ia"].write(self._app.light.ambient)
-        self._shader_program["light.Id"].write(self._app.light.diffuse)
-        self._shader_program["light.Is"].write(self._app.light.specular)
-
-    def _load_texture(self, texture_path: str) -> mgl.Texture:
+    def _load_texture(
+        self, texture_path: str, image: tuple = None
+    ) -> mgl.Texture:
         """
-        Returns the texture for the OpenGL object.
+        Returns the texture for the OpenGL object, shared with the other
+        objects of the context.
 
         Returns:
             mgl.Texture: The texture for the OpenGL object.
 
         Args:
             texture_path (str): The path to the texture.
+            image (tuple): The already decoded texture, if any.
         """
-        image = Image.open(texture_path)
-        image = image.transpose(Image.FLIP_TOP_BOTTOM)
-        image = image.convert("RGB")
-        image_data = image.tobytes()
-        texture = self._mgl_context.texture(
-            size=image.size,
-            components=3,
-            data=image_data,
-        )
-        return texture
+        return self._app.textures.acquire(texture_path, image)
 
     # ====== PROPERTIES ====== #
 
+    @property
+    def pos(self) -> tuple[float]:
+        """
+        tuple[float]: The position of the OpenGlObject.
+        """
+        return self._pos
+
+    @pos.setter
+    def pos(self, pos: tuple[float]) -> None:
+        """
+        Sets the position of the OpenGlObject.
+
+        Args:
+            pos (tuple[float]): The position.
+        """
+        self._pos = pos
+        self._invalidate_transform()
+        self._notify("pos")
+
+    @property
+    def rot(self) -> tuple[float]:
+        """
+        tuple[float]: The rotation of the OpenGlObject, in radians.
+        """
+        return self._rot
+
+    @rot.setter
+    def rot(self, rot: tuple[float]) -> None:
+        """
+        Sets the rotation of the OpenGlObject.
+
+        Args:
+            rot (tuple[float]): The rotation, in radians.
+        """
+        self._rot = rot
+        self._invalidate_transform()
+        self._notify("rot")
+
+    @property
+    def scale(self) -> tuple[float]:
+        """
+        tuple[float]: The scale of the OpenGlObject.
+        """
+        return self._scale
+
+    @scale.setter
+    def scale(self, scale: tuple[float]) -> None:
+        """
+        Sets the scale of the OpenGlObject.
+
+        Args:
+            scale (tuple[float]): The scale.
+        """
+        self._scale = scale
+        self._invalidate_transform()
+        self._notify("scale")
+
     @property
     def m_model(self) -> glm.mat4:
         """
-        [READ-ONLY] glm.mat4: The model matrix for the OpenGlObject.
+        [READ-ONLY] glm.mat4: The model matrix for the OpenGlObject, rebuilt
+        only after the transform changed.
+        """
+        if self._m_model is None:
+            self._m_model = self._get_model_matrix()
+        return self._m_model
+
+    @property
+    def m_normal(self) -> glm.mat3:
+        """
+        [READ-ONLY] glm.mat3: The normal matrix for the OpenGlObject, the
+        inverse transpose of the model matrix, rebuilt only after the
+        transform changed.
+        """
+        if self._m_normal is None:
+            self._m_normal = glm.transpose(glm.inverse(glm.mat3(self.m_model)))
+        return self._m_normal
+
+    @property
+    def world_bounds(self) -> np.ndarray | None:
+        """
+        [READ-ONLY] np.ndarray | None: The world space bounds of the
+        OpenGlObject, rebuilt only after the transform changed: the center
+        and the half extents of its axis aligned bounding box and the
+        radius of its bounding sphere, seven floats. None until its geometry
+        is loaded.
+        """
+        if self._bounds is None:
+            return None
+        if self._world_bounds is None:
+            m_model = np.array(self.m_model, dtype="f8")
+            rotation, translation = m_model[:3, :3], m_model[:3, 3]
+            minimum, maximum = self._bounds[0:3], self._bounds[3:6]
+            center = rotation @ ((minimum + maximum) / 2) + translation
+            extent = np.abs(rotation) @ ((maximum - minimum) / 2)
+            radius = self._bounds[6] * np.linalg.norm(rotation, axis=0).max()
+            self._world_bounds = np.concatenate([center, extent, [radius]])
+        return self._world_bounds
+
+    @property
+    def transform_version(self) -> int:
+        """
+        [READ-ONLY] int: A counter increased on every transform change.
+        """
+        return self._transform_version
+
+    @property
+    def vertex_format(self) -> tuple:
+        """
+        [READ-ONLY] tuple: The vertex buffer of the current level of detail
+        of the OpenGlObject with its format and attribute names, as used to
+        build a vertex array.
+        """
+        return self._get_vertex_format(self._vbo)
+
+    @property
+    def lod(self) -> int:
+        """
+        int: The level of detail drawn, 0 being the full geometry. Clamped
+        to the levels the OpenGlObject has.
         """
-        return self._get_model_matrix()
+        return self._lod
+
+    @lod.setter
+    def lod(self, value: int) -> None:
+        level = max(0, min(value, len(self._lods) - 1))
+        if self._pre_rendered and level != self._lod:
+            self._set_lod(level)
+
+    @property
+    def lod_count(self) -> int:
+        """
+        [READ-ONLY] int: The number of levels of detail of the OpenGlObject,
+        0 until it is pre-rendered.
+        """
+        return len(self._lods)
+
+    @property
+    def loading(self) -> bool:
+        """
+        [READ-ONLY] bool: Whether the assets of the OpenGlObject are still
+        being loaded in the background.
+        """
+        return self._loading
 
     @property
     def texture(self) -> mgl.Texture:
@@ -264,26 +563,75 @@ class OpenGLObject(ABC):
         Args:
             texture_path (str): The path to the texture.
         """
+        previous = getattr(self, "_texture", None)
+
+        self._texture_path = texture_path
         if texture_path is not None:
             self._texture = self._load_texture(texture_path)
         else:
             self._texture = None
 
+        if previous is not None:
+            self._app.textures.release(previous)
+
     # ====== PUBLIC METHODS ====== #
 
+    def set_component(
+        self, property_name: str, index: int, value: float
+    ) -> None:
+        """
+        Sets one component of the position, rotation or scale. Unchanged
+        values are ignored.
+
+        Args:
+            property_name (str): "pos", "rot" or "scale".
+            index (int): The component, 0 to 2 for x, y and z.
+            value (float): The value, rotations in radians.
+        """
+        values = getattr(self, f"_{property_name}")
+        if values[index] == value:
+            return
+        setattr(
+            self,
+            property_name,
+            (*values[:index], value, *values[index + 1:])
+        )
+
+    def subscribe(self, listener: ObjectListener) -> None:
+        """
+        Registers a listener for changes of the transform.
+
+        Args:
+            listener (Callable): Called with the property name and the
+                object.
+        """
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: ObjectListener) -> None:
+        """
+        Unregisters a listener.
+
+        Args:
+            listener (Callable): The listener.
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
     def update(self) -> None:  # TMP to show the spin
         """
         Spins the OpenGlObject.
         """
         m_model = glm.rotate(self.m_model, self._app._time, glm.vec3(0, 1, 0))
         self._shader_program["m_model"].write(m_model)
-        self._shader_program["m_view"].write(self._app.camera.m_view)
-        self._shader_program["camPos"].write(self._app.camera._position)
 
     def render(self) -> None:
         """
-        Renders the OpenGlObject.
+        Renders the OpenGlObject, or a placeholder while it is loading.
         """
+        if self._loading:
+            self._app.asset_loader.render_placeholder(self)
+            return
+
         if not self._pre_rendered:
             self._pre_render()
 
@@ -295,6 +643,15 @@ class OpenGLObject(ABC):
         """
         Destroys the OpenGlObject.
         """
-        self._vbo.release()
-        self._shader_program.release()
-        self._vao.release()
+        self._loading = False
+        if self._pre_rendered:
+            for vbo, ibo, vao in self._lods:
+                self._app.meshes.release(vao)
+                self._app.meshes.release(ibo)
+                self._app.meshes.release(vbo)
+            self._lods = []
+            self._app.shader_programs.release(self._shader_program)
+            self._pre_rendered = False
+        if self._texture is not None:
+            self._app.textures.release(self._texture)
+            self._texture = None
@@ -0,0 +1,172 @@
+"""
+This file contains the Scene class.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from src.objects.opengl_object import OpenGLObject
+
+
+SceneListener = Callable[[str, "OpenGLObject"], None]
+
+
+class Scene:
+    """
+    Class for the objects of a scene, indexed by name.
+
+    Every object gets a stable ID when it is added, which is never reused.
+    Lookup by name or ID, adding and removing are O(1), and iteration
+    follows the order the objects were added in. Listeners are notified
+    with `ADDED` or `REMOVED` and the object on every change.
+    """
+
+    ADDED = "added"
+    REMOVED = "removed"
+
+    def __init__(self, objects: Iterable[OpenGLObject] = ()) -> None:
+        self._objects = {}
+        self._ids_by_name = {}
+        self._next_id = 0
+        self._listeners = []
+
+        for obj in objects:
+            self.add(obj)
+
+    # ====== PROPERTIES ====== #
+
+    @property
+    def names(self) -> list[str]:
+        """
+        [READ-ONLY] list[str]: The names of the objects, in order.
+        """
+        return list(self._ids_by_name)
+
+    # ====== PRIVATE METHODS ====== #
+
+    def _notify(self, event: str, obj: OpenGLObject) -> None:
+        """
+        Notifies the listeners of a change.
+
+        Args:
+            event (str): `ADDED` or `REMOVED`.
+            obj (OpenGLObject): The changed object.
+        """
+        for listener in list(self._listeners):
+            listener(event, obj)
+
+    # ====== PUBLIC METHODS ====== #
+
+    def add(self, obj: OpenGLObject) -> int:
+        """
+        Adds an object to the scene.
+
+        Args:
+            obj (OpenGLObject): The object.
+
+        Returns:
+            int: The ID of the object.
+
+        Raises:
+            ValueError: If the scene has an object with the same name.
+        """
+        if obj._name in self._ids_by_name:
+            raise ValueError(f"Object {obj._name} already exists")
+
+        object_id = self._next_id
+        self._next_id += 1
+        self._objects[object_id] = obj
+        self._ids_by_name[obj._name] = object_id
+        self._notify(self.ADDED, obj)
+        return object_id
+
+    def remove(self, obj: OpenGLObject) -> None:
+        """
+        Removes an object from the scene. Objects that are not in the scene
+        are ignored.
+
+        Args:
+            obj (OpenGLObject): The object.
+        """
+        object_id = self._ids_by_name.get(obj._name)
+        if object_id is None or self._objects[object_id] is not obj:
+            return
+
+        del self._objects[object_id]
+        del self._ids_by_name[obj._name]
+        self._notify(self.REMOVED, obj)
+
+    def clear(self) -> None:
+        """
+        Removes every object from the scene.
+        """
+        for obj in list(self._objects.values()):
+            self.remove(obj)
+
+    def get(self, name: str) -> OpenGLObject | None:
+        """
+        Returns the object with the name.
+
+        Args:
+            name (str): The name of the object.
+
+        Returns:
+            OpenGLObject | None: The object, or None if there is none.
+        """
+        object_id = self._ids_by_name.get(name)
+        return self._objects.get(object_id)
+
+    def get_by_id(self, object_id: int) -> OpenGLObject | None:
+        """
+        Returns the object with the ID.
+
+        Args:
+            object_id (int): The ID of the object.
+
+        Returns:
+            OpenGLObject | None: The object, or None if there is none.
+        """
+        return self._objects.get(object_id)
+
+    def id_of(self, obj: OpenGLObject) -> int | None:
+        """
+        Returns the ID of an object.
+
+        Args:
+            obj (OpenGLObject): The object.
+
+        Returns:
+            int | None: The ID, or None if the object is not in the scene.
+        """
+        object_id = self._ids_by_name.get(obj._name)
+        if object_id is None or self._objects[object_id] is not obj:
+            return None
+        return object_id
+
+    def subscribe(self, listener: SceneListener) -> None:
+        """
+        Registers a listener for changes of the scene.
+
+        Args:
+            listener (Callable): Called with the event and the object.
+        """
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: SceneListener) -> None:
+        """
+        Unregisters a listener.
+
+        Args:
+            listener (Callable): The listener.
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids_by_name
+
+    def __iter__(self) -> Iterator[OpenGLObject]:
+        return iter(self._objects.values())
+
+    def __len__(self) -> int:
+        return len(self._objects)
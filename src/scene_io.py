@@ -0,0 +1,205 @@
+"""
+This file contains saving and loading of scenes together with their key
+frames, so that an animation can be rendered outside of the GUI.
+
+Scene files are JSON documents of the form::
+
+    {
+        "frames": {"start": 0, "end": 200},
+        "objects": [
+            {
+                "type": "cube" | "model3d",
+                "name": "Cube 1",
+                "texture_path": "src/textures/crate.png",
+                "object_path": null,
+                "pos": [0, 0, 0],
+                "rot": [0, 0, 0],
+                "scale": [1, 1, 1]
+            }
+        ],
+        "key_frames": {
+            "Cube 1": {"0": {"pos": [...], "rot": [...], "scale": [...]}}
+        },
+        "camera": {"position": [0, 0, 4], "yaw": -90, "pitch": 0},
+        "light": {"position": [0, 30, 10]}
+    }
+
+Rotations are stored in degrees, both for objects and key frames. The
+camera and light are optional; scenes without them use the defaults.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.camera import Camera
+    from src.light import Light
+    from src.objects.opengl_object import OpenGLObject
+
+import json
+
+import glm
+
+from src.objects.cube import Cube
+from src.objects.model_3d import Model3D
+
+
+OBJECT_TYPES = {
+    "cube": Cube,
+    "model3d": Model3D,
+}
+
+
+def _to_degrees(rot) -> list[float]:
+    """
+    Converts a rotation in radians to a list of degrees.
+
+    :param rot: The rotation in radians.
+    """
+    return [glm.degrees(a) for a in rot]
+
+
+def _to_radians(rot) -> tuple[float]:
+    """
+    Converts a rotation in degrees to a tuple of radians.
+
+    :param rot: The rotation in degrees.
+    """
+    return tuple(glm.radians(a) for a in rot)
+
+
+def save_scene(
+        path: str,
+        scene: list[OpenGLObject],
+        key_frames: dict[str, dict[int, tuple]],
+        frames: tuple[int, int],
+        camera: Camera = None,
+        light: Light = None
+        ) -> None:
+    """
+    Saves the scene and its key frames to a JSON file.
+
+    :param path: The path of the scene file.
+    :param scene: The objects of the scene.
+    :param key_frames: The key frames of the objects, by object name.
+    :param frames: The first and last frame of the animation.
+    :param camera: The camera whose view is saved, if any.
+    :param light: The light whose position is saved, if any.
+    """
+    type_names = {cls: name for name, cls in OBJECT_TYPES.items()}
+    objects = []
+    for obj in scene:
+        objects.append({
+            "type": type_names[type(obj)],
+            "name": obj._name,
+            "texture_path": obj._texture_path,
+            "object_path": getattr(obj, "_object_path", None),
+            "pos": list(obj._pos),
+            "rot": _to_degrees(obj._rot),
+            "scale": list(obj._scale),
+        })
+
+    frames_data = {}
+    for obj_name, keyframes in key_frames.items():
+        frames_data[obj_name] = {
+            str(frame): {
+                "pos": list(pos),
+                "rot": _to_degrees(rot),
+                "scale": list(scale),
+            }
+            for frame, (pos, rot, scale) in keyframes.items()
+        }
+
+    data = {
+        "frames": {"start": frames[0], "end": frames[1]},
+        "objects": objects,
+        "key_frames": frames_data,
+    }
+    if camera is not None:
+        data["camera"] = {
+            "position": list(camera.position),
+            "yaw": camera.yaw,
+            "pitch": camera.pitch,
+        }
+    if light is not None:
+        data["light"] = {"position": list(light.position)}
+    with open(path, "w") as f:
+        json.dump(data, f, indent=4)
+
+
+def load_scene(
+        path: str,
+        app,
+        pre_render: bool = True,
+        camera: Camera = None,
+        light: Light = None
+        ) -> tuple[list[OpenGLObject], dict[str, dict[int, tuple]], tuple]:
+    """
+    Loads the scene and its key frames from a JSON file.
+
+    :param path: The path of the scene file.
+    :param app: The engine the objects are created for.
+    :param pre_render: Whether to upload the assets of the objects now;
+        otherwise they are left to an `AssetLoader`.
+    :param camera: The camera to move to the saved view, if any.
+    :param light: The light to move to the saved position, if any.
+
+    Returns:
+        tuple: The objects, the key frames by object name and the first and
+        last frame of the animation.
+    """
+    with open(path, "r") as f:
+        data = json.load(f)
+
+    scene = []
+    for obj_data in data["objects"]:
+        if obj_data["type"] not in OBJECT_TYPES:
+            raise ValueError(f"Unknown object type: {obj_data['type']}")
+        kwargs = {
+            "texture_path": obj_data.get("texture_path"),
+            "pos": tuple(obj_data["pos"]),
+            "rot": tuple(obj_data["rot"]),
+            "scale": tuple(obj_data["scale"]),
+            "name": obj_data["name"],
+            "pre_render": pre_render,
+        }
+        if obj_data["type"] == "model3d":
+            kwargs["object_path"] = obj_data["object_path"]
+        scene.append(OBJECT_TYPES[obj_data["type"]](app, **kwargs))
+
+    key_frames = {}
+    for obj_name, keyframes in data.get("key_frames", {}).items():
+        key_frames[obj_name] = {
+            int(frame): (
+                tuple(values["pos"]),
+                _to_radians(values["rot"]),
+                tuple(values["scale"]),
+            )
+            for frame, values in keyframes.items()
+        }
+
+    if camera is not None and "camera" in data:
+        camera_data = data["camera"]
+        camera.set_view(
+            tuple(camera_data["position"]),
+            camera_data["yaw"],
+            camera_data["pitch"]
+        )
+    if light is not None and "light" in data:
+        light.position = tuple(data["light"]["position"])
+
+    frames = data["frames"]["start"], data["frames"]["end"]
+    return scene, key_frames, frames
+
+
+def load_frames(path: str) -> tuple[int, int]:
+    """
+    Loads only the frame range of a scene file, without creating objects.
+
+    :param path: The path of the scene file.
+
+    Returns:
+        tuple[int, int]: The first and last frame of the animation.
+    """
+    with open(path, "r") as f:
+        data = json.load(f)
+    return data["frames"]["start"], data["frames"]["end"]
@@ -0,0 +1,127 @@
+"""
+This file contains the ShaderProgramCache class.
+"""
+import hashlib
+
+import moderngl as mgl
+
+from src.constants import OPENGL_CONSTANTS
+
+
+class ShaderProgramCache:
+    """
+    Class for sharing compiled shader programs within a moderngl context.
+
+    Programs are keyed by shader name and a hash of their sources, compiled
+    once and reference counted; a program is released when its last user
+    releases it. The sources and their hash are read once per pair of
+    shader names, so acquiring a cached program touches no files. Programs
+    declaring the per-frame uniform block get it linked to its binding
+    point on compilation.
+    """
+
+    def __init__(self, ctx: mgl.Context) -> None:
+        self._ctx = ctx
+        self._programs = {}
+        self._ref_counts = {}
+        self._keys = {}
+        self._sources = {}
+
+    # ====== PRIVATE METHODS ====== #
+
+    @staticmethod
+    def _read_sources(
+        shader_name: str, fragment_shader_name: str
+    ) -> tuple[str, str]:
+        """
+        Reads the sources of the shader program.
+
+        Args:
+            shader_name (str): The name of the vertex shader.
+            fragment_shader_name (str): The name of the fragment shader.
+
+        Returns:
+            tuple[str, str]: The vertex and fragment shader sources.
+        """
+        with open(f"src/shaders/{shader_name}.vert", "r") as f:
+            vertex_shader_source = f.read()
+
+        with open(f"src/shaders/{fragment_shader_name}.frag", "r") as f:
+            fragment_shader_source = f.read()
+
+        return vertex_shader_source, fragment_shader_source
+
+    # ====== PUBLIC METHODS ====== #
+
+    def acquire(
+        self, shader_name: str, fragment_shader_name: str = None
+    ) -> mgl.Program:
+        """
+        Returns the shader program, compiling it on first use.
+
+        Args:
+            shader_name (str): The name of the shader program.
+            fragment_shader_name (str): The name of the fragment shader, if
+                it differs from the name of the shader program.
+
+        Returns:
+            mgl.Program: The shared shader program.
+        """
+        names = (shader_name, fragment_shader_name or shader_name)
+        if names not in self._sources:
+            sources = self._read_sources(*names)
+            digest = hashlib.sha1("\0".join(sources).encode()).hexdigest()
+            self._sources[names] = (sources, (shader_name, digest))
+        (vertex_shader_source, fragment_shader_source), key = (
+            self._sources[names]
+        )
+
+        if key not in self._programs:
+            program = self._ctx.program(
+                vertex_shader=vertex_shader_source,
+                fragment_shader=fragment_shader_source
+            )
+            if OPENGL_CONSTANTS.FRAME_UNIFORM_BLOCK in program:
+                program[OPENGL_CONSTANTS.FRAME_UNIFORM_BLOCK].binding = (
+                    OPENGL_CONSTANTS.FRAME_UNIFORM_BINDING
+                )
+            self._programs[key] = program
+            self._ref_counts[key] = 0
+            self._keys[program.glo] = key
+
+        self._ref_counts[key] += 1
+        return self._programs[key]
+
+    def release(self, program: mgl.Program) -> None:
+        """
+        Drops one reference to the shader program, releasing it when no
+        users are left.
+
+        Args:
+            program (mgl.Program): The shader program.
+        """
+        key = self._keys.get(program.glo)
+        if key is None:
+            return
+
+        self._ref_counts[key] -= 1
+        if self._ref_counts[key] == 0:
+            del self._programs[key]
+            del self._ref_counts[key]
+            del self._keys[program.glo]
+            program.release()
+
+    def ref_count(self, shader_name: str) -> int:
+        """
+        Returns the number of users of the shader programs with that name.
+
+        Args:
+            shader_name (str): The name of the shader program.
+
+        Returns:
+            int: The number of users.
+        """
+        return sum(
+            count for (name, _), count in self._ref_counts.items()
+            if name == shader_name
+        )
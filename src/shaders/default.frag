@@ -13,9 +13,14 @@ struct Light {
     vec3 Is;
 };
 
-uniform Light light;
+layout (std140) uniform FrameData {
+    mat4 m_proj;
+    mat4 m_view;
+    vec3 camPos;
+    Light light;
+};
+
 uniform sampler2D u_texture_0;
-uniform vec3 camPos;
 
 vec3 getLight(vec3 color) {
     vec3 Normal = normalize(normal);
@@ -8,12 +8,26 @@ out vec2 uv_0;
 out vec3 normal;
 out vec3 fragPos;
 
-uniform mat4 m_proj;
-uniform mat4 m_view;
+struct Light {
+    vec3 position;
+    vec3 Ia;
+    vec3 Id;
+    vec3 Is;
+};
+
+layout (std140) uniform FrameData {
+    mat4 m_proj;
+    mat4 m_view;
+    vec3 camPos;
+    Light light;
+};
+
 uniform mat4 m_model;
+uniform mat3 m_normal;
 
 void main() {
     uv_0 = in_texcoord_0;
-    normal = mat3(transpose(inverse(m_model))) * normalize(in_normal);
+    normal = m_normal * normalize(in_normal);
+    fragPos = vec3(m_model * vec4(in_position, 1.0));
     gl_Position = m_proj * m_view * m_model * vec4(in_position, 1.0);
 }
\ No newline at end of file
@@ -0,0 +1,32 @@
+#version 330 core
+
+layout (location = 0) in vec2 in_texcoord_0;
+layout (location = 1) in vec3 in_normal;
+layout (location = 2) in vec3 in_position;
+layout (location = 3) in mat4 in_m_model;
+layout (location = 7) in mat3 in_m_normal;
+
+out vec2 uv_0;
+out vec3 normal;
+out vec3 fragPos;
+
+struct Light {
+    vec3 position;
+    vec3 Ia;
+    vec3 Id;
+    vec3 Is;
+};
+
+layout (std140) uniform FrameData {
+    mat4 m_proj;
+    mat4 m_view;
+    vec3 camPos;
+    Light light;
+};
+
+void main() {
+    uv_0 = in_texcoord_0;
+    normal = in_m_normal * normalize(in_normal);
+    fragPos = vec3(in_m_model * vec4(in_position, 1.0));
+    gl_Position = m_proj * m_view * vec4(fragPos, 1.0);
+}
\ No newline at end of file
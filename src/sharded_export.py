@@ -0,0 +1,150 @@
+"""
+This file contains the sharded export, which renders contiguous frame
+ranges of an animation in separate processes and joins them into one video.
+
+Every worker process builds its own headless engine and loads its own copy
+of the scene and key frames. It JPEG encodes its frames into a segment file
+of length-prefixed frames. The segments are then copied into a single MJPG
+AVI in frame order, without being decoded or re-encoded.
+"""
+import multiprocessing
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+
+import cv2
+
+from src.avi_writer import MjpegAviWriter
+from src.constants import (
+    GUI_ANIMATION_WIDGET_CONSTANTS,
+    HEADLESS_CONSTANTS,
+    EXPORT_CONSTANTS,
+)
+from src.headless_engine import HeadlessEngine
+from src.scene_io import load_frames
+
+
+def split_frames(
+        frames: tuple[int, int],
+        shards: int
+        ) -> list[tuple[int, int]]:
+    """
+    Splits a frame range into contiguous shards of nearly equal length.
+
+    :param frames: The first and last frame of the range.
+    :param shards: The maximum number of shards.
+    """
+    first, last = frames
+    count = last - first + 1
+    shards = max(1, min(shards, count))
+    ranges = []
+    start = first
+    for i in range(shards):
+        length = count // shards + (1 if i < count % shards else 0)
+        ranges.append((start, start + length - 1))
+        start += length
+    return ranges
+
+
+def _render_shard(
+        scene_path: str,
+        frames: tuple[int, int],
+        segment_path: str,
+        win_size: tuple[int, int],
+        backend: str
+        ) -> int:
+    """
+    Renders one shard into a segment file. Runs in a worker process.
+
+    :param scene_path: The path of the scene file.
+    :param frames: The first and last frame of the shard.
+    :param segment_path: The path of the segment file.
+    :param win_size: The size of the frames.
+    :param backend: The glcontext backend to use, or None.
+
+    Returns:
+        int: The number of rendered frames.
+    """
+    engine = HeadlessEngine(win_size, backend)
+    key_frames, _ = engine.load_scene(scene_path)
+    params = [cv2.IMWRITE_JPEG_QUALITY, EXPORT_CONSTANTS.JPEG_QUALITY]
+    count = 0
+    with open(segment_path, "wb") as f:
+        for frame in engine.render_frames(key_frames, frames):
+            _, jpeg = cv2.imencode(".jpg", frame, params)
+            f.write(struct.pack("<I", len(jpeg)))
+            f.write(jpeg.tobytes())
+            count += 1
+    engine.destroy()
+    return count
+
+
+def _copy_segment(segment_path: str, writer: MjpegAviWriter) -> None:
+    """
+    Copies the frames of a segment file into the output video.
+
+    :param segment_path: The path of the segment file.
+    :param writer: The writer of the output video.
+    """
+    with open(segment_path, "rb") as f:
+        while header := f.read(4):
+            (length,) = struct.unpack("<I", header)
+            writer.write(f.read(length))
+
+
+def render_sharded(
+        scene_path: str,
+        workers: int = None,
+        file_name: str = GUI_ANIMATION_WIDGET_CONSTANTS.OUTPUT_FILE_NAME,
+        fps: float = GUI_ANIMATION_WIDGET_CONSTANTS.OUTPUT_FPS,
+        win_size: tuple[int, int] = (
+            HEADLESS_CONSTANTS.WIDTH,
+            HEADLESS_CONSTANTS.HEIGHT
+        ),
+        backend: str = None
+        ) -> int:
+    """
+    Renders the animation of a scene file across worker processes.
+
+    Segments are joined as soon as they and all earlier segments are done,
+    so joining overlaps with rendering of the later shards.
+
+    :param scene_path: The path of the scene file.
+    :param workers: The number of worker processes, all cores by default.
+    :param file_name: The name of the output file, without extension.
+    :param fps: The frame rate of the output file.
+    :param win_size: The size of the frames.
+    :param backend: The glcontext backend to use, or None.
+
+    Returns:
+        int: The number of rendered frames.
+    """
+    shards = split_frames(load_frames(scene_path), workers or os.cpu_count())
+    segment_paths = [
+        f"{file_name}{EXPORT_CONSTANTS.SEGMENT_SUFFIX}{i}"
+        for i in range(len(shards))
+    ]
+
+    # GL contexts do not survive a fork, so workers always start fresh
+    context = multiprocessing.get_context("spawn")
+    writer = MjpegAviWriter(f"{file_name}.avi", win_size, fps)
+    count = 0
+    try:
+        with ProcessPoolExecutor(len(shards), mp_context=context) as pool:
+            futures = [
+                pool.submit(
+                    _render_shard, scene_path, shard, segment_path,
+                    win_size, backend
+                )
+                for shard, segment_path in zip(shards, segment_paths)
+            ]
+            for future, segment_path in zip(futures, segment_paths):
+                count += future.result()
+                _copy_segment(segment_path, writer)
+                os.remove(segment_path)
+    finally:
+        writer.release()
+        for segment_path in segment_paths:
+            if os.path.exists(segment_path):
+                os.remove(segment_path)
+    return count
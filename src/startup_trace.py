@@ -0,0 +1,118 @@
+"""
+This file contains the startup trace, which records how long importing and
+initializing every subsystem takes until the window shows its first frame.
+
+The trace is kept per process, so any module can add a span without being
+handed a trace object. Spans cost a single check until `start` is called.
+This module only uses the standard library, so importing it does not
+distort the timings it records.
+"""
+from __future__ import annotations
+
+import importlib
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Iterator
+
+_origin = None
+_depth = 0
+_events = []
+
+
+def start(origin: float = None) -> None:
+    """
+    Starts tracing.
+
+    :param origin: The `time.perf_counter` value the timings are relative
+        to, e.g. taken before the first import. Now by default.
+    """
+    global _origin
+    _origin = time.perf_counter() if origin is None else origin
+    _events.clear()
+
+
+def is_enabled() -> bool:
+    """
+    Returns whether the startup is traced.
+    """
+    return _origin is not None
+
+
+def elapsed() -> float:
+    """
+    Returns the seconds since the trace started.
+    """
+    return time.perf_counter() - _origin
+
+
+@contextmanager
+def _span(name: str) -> Iterator[None]:
+    """
+    Records how long the wrapped code takes, nested under the open spans.
+
+    :param name: The name of the span.
+    """
+    global _depth
+    event = [name, _depth, elapsed(), 0.0]
+    _events.append(event)
+    _depth += 1
+    try:
+        yield
+    finally:
+        _depth -= 1
+        event[3] = elapsed() - event[2]
+
+
+def span(name: str):
+    """
+    Returns a context manager recording how long the code it wraps takes.
+
+    :param name: The name of the span, e.g. a subsystem.
+    """
+    if _origin is None:
+        return nullcontext()
+    return _span(name)
+
+
+def mark(name: str) -> None:
+    """
+    Records a point in time, e.g. the first frame.
+
+    :param name: The name of the point.
+    """
+    if _origin is not None:
+        _events.append([name, _depth, elapsed(), None])
+
+
+def import_modules(names: tuple[str]) -> None:
+    """
+    Imports modules in order, each in its own span. Every span only holds
+    the modules not imported by the ones before it, so importing the
+    dependencies first splits the import time by subsystem.
+
+    :param names: The names of the modules.
+    """
+    for name in names:
+        with span(f"import {name}"):
+            importlib.import_module(name)
+
+
+def report(deferred: tuple[str] = ()) -> str:
+    """
+    Returns the trace as a table.
+
+    :param deferred: Modules that should not be imported at startup. They
+        are listed with whether they were imported anyway.
+
+    Returns:
+        str: One line per span and mark.
+    """
+    lines = [f"{'at':>8}{'took':>8}  ms"]
+    for name, depth, at, took in _events:
+        took = "" if took is None else f"{took * 1000:>8.1f}"
+        lines.append(f"{at * 1000:>8.1f}{took:>8}  {'  ' * depth}{name}")
+    for name in deferred:
+        state = "imported" if name in sys.modules else "deferred"
+        lines.append(f"{'':>16}  {name}: {state}")
+    return "\n".join(lines)
@@ -0,0 +1,205 @@
+"""
+This file contains the TextureCache class.
+"""
+import os
+from collections import OrderedDict
+
+import moderngl as mgl
+from PIL import Image
+
+from src.constants import OPENGL_CONSTANTS
+
+
+class TextureCache:
+    """
+    Class for sharing textures within a moderngl context.
+
+    Textures are keyed by path and modification time and reference counted.
+    Textures without users stay resident for reuse until the total size goes
+    over the VRAM budget, at which point the least recently used of them are
+    released.
+    """
+
+    def __init__(
+        self,
+        ctx: mgl.Context,
+        budget: int = OPENGL_CONSTANTS.TEXTURE_VRAM_BUDGET
+    ) -> None:
+        self._ctx = ctx
+        self._budget = budget
+        self._textures = OrderedDict()
+        self._ref_counts = {}
+        self._sizes = {}
+        self._keys = {}
+        self._used = 0
+
+    # ====== PROPERTIES ====== #
+
+    @property
+    def budget(self) -> int:
+        """
+        int: The VRAM budget for textures, in bytes.
+        """
+        return self._budget
+
+    @budget.setter
+    def budget(self, budget: int) -> None:
+        """
+        Sets the VRAM budget and evicts textures to fit it.
+
+        Args:
+            budget (int): The VRAM budget, in bytes.
+        """
+        self._budget = budget
+        self._evict()
+
+    @property
+    def used(self) -> int:
+        """
+        [READ-ONLY] Returns the size of the resident textures.
+
+        Returns:
+            int: The size of the resident textures, in bytes.
+        """
+        return self._used
+
+    # ====== PRIVATE METHODS ====== #
+
+    @staticmethod
+    def _get_key(texture_path: str) -> tuple:
+        """
+        Returns the key of the texture.
+
+        Args:
+            texture_path (str): The path to the texture.
+
+        Returns:
+            tuple: The absolute path and modification time of the texture.
+        """
+        path = os.path.abspath(texture_path)
+        return (path, os.stat(path).st_mtime_ns)
+
+    def _drop(self, key: tuple) -> None:
+        """
+        Releases the texture stored under the key.
+
+        Args:
+            key (tuple): The key of the texture.
+        """
+        texture = self._textures.pop(key)
+        self._used -= self._sizes.pop(key)
+        del self._ref_counts[key]
+        del self._keys[texture.glo]
+        texture.release()
+
+    def _evict(self) -> None:
+        """
+        Releases unused textures, least recently used first, until the
+        resident textures fit the budget.
+        """
+        for key in list(self._textures):
+            if self._used <= self._budget:
+                return
+            if self._ref_counts[key] == 0:
+                self._drop(key)
+
+    # ====== PUBLIC METHODS ====== #
+
+    @staticmethod
+    def decode(texture_path: str) -> tuple[tuple[int, int], bytes]:
+        """
+        Decodes the image of the texture. Does not touch the GL context, so
+        it can run on a worker thread.
+
+        Args:
+            texture_path (str): The path to the texture.
+
+        Returns:
+            tuple: The size and the RGB data of the image.
+        """
+        image = Image.open(texture_path)
+        image = image.transpose(Image.FLIP_TOP_BOTTOM)
+        image = image.convert("RGB")
+        return image.size, image.tobytes()
+
+    def contains(self, texture_path: str) -> bool:
+        """
+        Checks whether the current version of the texture is resident.
+
+        Args:
+            texture_path (str): The path to the texture.
+
+        Returns:
+            bool: True if the texture is resident.
+        """
+        try:
+            return self._get_key(texture_path) in self._textures
+        except OSError:
+            return False
+
+    def acquire(
+        self, texture_path: str, image: tuple = None
+    ) -> mgl.Texture:
+        """
+        Returns the texture, loading it on first use.
+
+        Args:
+            texture_path (str): The path to the texture.
+            image (tuple): The already decoded image, see `decode`.
+
+        Returns:
+            mgl.Texture: The shared texture.
+        """
+        key = self._get_key(texture_path)
+        path = key[0]
+
+        if key not in self._textures:
+            for stale in [k for k in self._textures if k[0] == path]:
+                if self._ref_counts[stale] == 0:
+                    self._drop(stale)
+
+            size, data = image if image is not None else self.decode(path)
+            texture = self._ctx.texture(size=size, components=3, data=data)
+            self._textures[key] = texture
+            self._ref_counts[key] = 0
+            self._sizes[key] = (
+                texture.width * texture.height * texture.components
+            )
+            self._keys[texture.glo] = key
+            self._used += self._sizes[key]
+
+        self._textures.move_to_end(key)
+        self._ref_counts[key] += 1
+        self._evict()
+        return self._textures[key]
+
+    def release(self, texture: mgl.Texture) -> None:
+        """
+        Drops one reference to the texture. Unused textures are kept until
+        the budget requires evicting them.
+
+        Args:
+            texture (mgl.Texture): The texture.
+        """
+        key = self._keys.get(texture.glo)
+        if key is None:
+            return
+
+        self._ref_counts[key] -= 1
+        self._evict()
+
+    def ref_count(self, texture_path: str) -> int:
+        """
+        Returns the number of users of the textures loaded from the path.
+
+        Args:
+            texture_path (str): The path to the texture.
+
+        Returns:
+            int: The number of users.
+        """
+        path = os.path.abspath(texture_path)
+        return sum(
+            count for (key_path, _), count in self._ref_counts.items()
+            if key_path == path
+        )
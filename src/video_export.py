@@ -0,0 +1,171 @@
+"""
+This file contains the helpers for writing rendered frames to a video file.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import cv2
+
+import queue
+import threading
+import time
+
+import numpy as np
+
+from src.constants import GUI_ANIMATION_WIDGET_CONSTANTS, EXPORT_CONSTANTS
+
+
+def open_video_writer(
+        size: tuple[int, int],
+        file_name: str = GUI_ANIMATION_WIDGET_CONSTANTS.OUTPUT_FILE_NAME,
+        fps: float = GUI_ANIMATION_WIDGET_CONSTANTS.OUTPUT_FPS
+        ) -> cv2.VideoWriter:
+    """
+    Opens a MJPG video writer for frames of the given size.
+
+    :param size: The width and height of the frames.
+    :param file_name: The name of the output file, without extension.
+    :param fps: The frame rate of the output file.
+    """
+    # OpenCV is only imported once a video is written, as it takes longer
+    # to import than the rest of the application.
+    import cv2
+
+    return cv2.VideoWriter(
+        f"{file_name}.avi",
+        cv2.VideoWriter_fourcc(*"MJPG"),
+        fps,
+        size
+    )
+
+
+class FrameEncoder:
+    """
+    Class for encoding frames on a worker thread.
+
+    Frames are handed over through a bounded queue and written in the order
+    they were submitted. When the queue is full `write` blocks, so the
+    renderer can never run more than `queue_size` frames ahead of the
+    encoder. The frames must stay untouched until they are encoded, which
+    takes at most `queue_size + 1` further calls to `write`.
+    """
+
+    def __init__(
+        self,
+        size: tuple[int, int],
+        file_name: str = GUI_ANIMATION_WIDGET_CONSTANTS.OUTPUT_FILE_NAME,
+        fps: float = GUI_ANIMATION_WIDGET_CONSTANTS.OUTPUT_FPS,
+        queue_size: int = EXPORT_CONSTANTS.ENCODER_QUEUE_SIZE
+    ) -> None:
+        self._writer = open_video_writer(size, file_name, fps)
+        self._queue = queue.Queue(maxsize=max(1, queue_size))
+        self._queue_waits = []
+        self._blocked_time = 0.0
+        self._encode_time = 0.0
+        self._error = None
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    # ====== PROPERTIES ====== #
+
+    @property
+    def queue_size(self) -> int:
+        """
+        [READ-ONLY] Returns the capacity of the frame queue.
+
+        Returns:
+            int: The capacity of the frame queue.
+        """
+        return self._queue.maxsize
+
+    @property
+    def queue_waits(self) -> list[float]:
+        """
+        [READ-ONLY] Returns how long each frame waited between being
+        submitted and being picked up by the encoder.
+
+        Returns:
+            list[float]: The wait of each encoded frame, in seconds.
+        """
+        return self._queue_waits
+
+    @property
+    def blocked_time(self) -> float:
+        """
+        [READ-ONLY] Returns how long the renderer was blocked by a full queue.
+
+        Returns:
+            float: The total blocked time, in seconds.
+        """
+        return self._blocked_time
+
+    # ====== PRIVATE METHODS ====== #
+
+    def _run(self) -> None:
+        """
+        Encodes the queued frames until the end of stream marker arrives.
+        """
+        import cv2
+
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            frame, queued_at = item
+            self._queue_waits.append(time.perf_counter() - queued_at)
+            if self._error is not None:
+                continue
+            start = time.perf_counter()
+            try:
+                self._writer.write(frame)
+            except cv2.error as err:
+                self._error = err
+            self._encode_time += time.perf_counter() - start
+
+    # ====== PUBLIC METHODS ====== #
+
+    def write(self, frame: np.ndarray) -> None:
+        """
+        Queues a frame for encoding, blocking while the queue is full.
+
+        Args:
+            frame (np.ndarray): The frame as a top-down BGR image.
+        """
+        start = time.perf_counter()
+        self._queue.put((frame, time.perf_counter()))
+        self._blocked_time += time.perf_counter() - start
+
+    def close(self) -> None:
+        """
+        Waits for the queued frames to be encoded and closes the file.
+
+        Raises:
+            cv2.error: If encoding any of the frames failed.
+        """
+        self._queue.put(None)
+        self._thread.join()
+        self._writer.release()
+        if self._error is not None:
+            raise self._error
+
+    def report(self) -> str:
+        """
+        Returns a summary of the queue waits. Frames that barely wait mean
+        rendering is the bottleneck; long waits and a blocked renderer mean
+        encoding is.
+
+        Returns:
+            str: The summary.
+        """
+        waits = np.array(self._queue_waits) * 1000
+        if len(waits) == 0:
+            return "encoder: no frames"
+        return (
+            f"encoder: {len(waits)} frames, "
+            f"queue wait mean {waits.mean():.2f} ms, "
+            f"max {waits.max():.2f} ms, "
+            f"encode {self._encode_time:.2f} s, "
+            f"renderer blocked {self._blocked_time:.2f} s"
+        )
@@ -17,6 +17,8 @@ from src.objects.cube import Cube
 from src.objects.model_3d import Model3D
 from src.constants import OPENGL_CONSTANTS, PROPERTIES_CONSTANTS
 from src.graphics_engine import GraphicsEngine
+from src.light import Light
+from src.scene import Scene
 
 
 class GUI(QWidget):
@@ -168,35 +170,22 @@ class GUI(QWidget):
         """
         Handles the selection change.
         """
-        selected_option = self.sender().currentText()
-        self.selected_object = next(
-            (obj for obj in self.ge._scene if obj._name == selected_option),
-            None
-        )
-
         if self.selected_object is not None:
-            degrees_rot = tuple(
-                glm.degrees(a) for a in self.selected_object._rot
-            )
-            property_groups = {
-                "pos": self.selected_object._pos,
-                "rot": degrees_rot,
-                "scale": self.selected_object._scale,
-            }
+            self.selected_object.unsubscribe(self.on_object_change)
 
-            for group_name, prop_values in property_groups.items():
-                components = ["x", "y", "z"]
+        selected_option = self.sender().currentText()
+        self.selected_object = self.ge.scene.get(selected_option)
 
-                for comp in components:
-                    spin_box_key = f"object.{group_name}.{comp}"
-                    spin_box_value = prop_values[components.index(comp)]
-                    self.properties_dict[spin_box_key].setValue(spin_box_value)
+        if self.selected_object is not None:
+            self.selected_object.subscribe(self.on_object_change)
+            for property_name in ["pos", "rot", "scale"]:
+                self.on_object_change(property_name, self.selected_object)
 
     def on_property_change(
         self, target: str, property_name: str, comp: int, value: float
     ) -> None:
         """
-        Handles the property change.
+        Handles the property change. The value is written in place.
 
         Args:
             target: the target of the properties (object or light)
@@ -204,23 +193,55 @@ class GUI(QWidget):
             comp: the component of the property (x, y, z)
             value: the value of the property
         """
-        obj = self.ge._light if target == "light" else self.selected_object
-        prop = getattr(obj, f"_{property_name}")
+        index = "xyz".index(comp)
+        if target == "light":
+            self.ge.light.set_position_component(index, value)
+        elif self.selected_object is not None:
+            if property_name == "rot":
+                value = glm.radians(value)
+            self.selected_object.set_component(property_name, index, value)
+        self.ge.request_render()
 
-        index = {"x": 0, "y": 1, "z": 2}[comp]
-        new_prop = list(prop)
+    def on_object_change(self, property_name: str, obj: Cube or Model3D):
+        """
+        Shows a changed property of the selected block.
 
+        Args:
+            property_name: the name of the property (pos, rot, scale)
+            obj: the changed block
+        """
+        values = getattr(obj, property_name)
         if property_name == "rot":
-            new_prop[index] = glm.radians(value)
-        else:
-            new_prop[index] = value
+            values = [glm.degrees(a) for a in values]
+        self.set_spin_boxes("object", property_name, values)
 
-        new_prop = tuple(new_prop)
+    def on_light_change(self, property_name: str, light: Light) -> None:
+        """
+        Shows a changed property of the light.
 
-        if target == "light":
-            new_prop = glm.vec3(new_prop)
+        Args:
+            property_name: the name of the property (position)
+            light: the light
+        """
+        values = getattr(light, property_name)
+        self.set_spin_boxes("light", property_name, values)
 
-        setattr(obj, f"_{property_name}", new_prop)
+    def set_spin_boxes(
+        self, target: str, property_name: str, values
+    ) -> None:
+        """
+        Shows the values of a property without emitting change signals.
+
+        Args:
+            target: the target of the properties (object or light)
+            property_name: the name of the property
+            values: the x, y and z values
+        """
+        for comp, value in zip("xyz", values):
+            spin_box = self.properties_dict[f"{target}.{property_name}.{comp}"]
+            spin_box.blockSignals(True)
+            spin_box.setValue(value)
+            spin_box.blockSignals(False)
 
     def on_remove_button_click(self) -> None:
         """
@@ -252,38 +273,47 @@ class GUI(QWidget):
 
     def update(self):
         """
-        Updates the state.
+        Connects the GUI to the scene and the light once the graphics engine
+        is initialized. From then on widgets are only updated by change
+        events.
         """
-        if self.render_initialized is False and self.ge._scene is not None:
+        if self.render_initialized is False and self.ge.scene is not None:
             self.update_dropdown()
+            self.ge.scene.subscribe(self.on_scene_change)
+            self.ge.light.subscribe(self.on_light_change)
+            self.on_light_change("position", self.ge.light)
             self.render_initialized = True
-        self.update_light()
-
-    def update_light(self) -> None:
-        """
-        Updates the light.
-        """
-        components = ["x", "y", "z"]
-        for comp in components:
-            spin_box_key = f"light.position.{comp}"
-            spin_box_value = self.ge._light._position[components.index(comp)]
-            self.properties_dict[spin_box_key].setValue(spin_box_value)
 
     def update_dropdown(self) -> None:
         """
         Updates the dropdown.
         """
         self.dropdown.clear()
-        for obj in self.ge._scene:
+        self.dropdown.addItems(self.ge.scene.names)
+
+    def on_scene_change(self, event: str, obj: Cube or Model3D) -> None:
+        """
+        Keeps the dropdown in sync with the scene.
+
+        Args:
+            event: the change of the scene (added or removed)
+            obj: the added or removed block
+        """
+        if event == Scene.ADDED:
             self.dropdown.addItem(obj._name)
+        elif event == Scene.REMOVED:
+            self.dropdown.removeItem(self.dropdown.findText(obj._name))
 
     def remove_block(self):
         """
-        Removes the selected block.
+        Removes the selected block. Removing it from the scene updates the
+        dropdown, which already selects the next block.
         """
-        self.ge._scene.remove(self.selected_object)
-        self.selected_object.destroy()
-        self.update_dropdown()
+        obj = self.selected_object
+        if obj is None:
+            return
+        self.ge.scene.remove(obj)
+        obj.destroy()
 
     def add_cube(self, block_name: str):
         """
@@ -296,6 +326,7 @@ class GUI(QWidget):
             rot=OPENGL_CONSTANTS.DEFAULT_ROTATION,
             scale=OPENGL_CONSTANTS.DEFAULT_SCALE,
             name=block_name,
+            pre_render=False,
         )
         self.add_block(block_name, cube)
 
@@ -313,21 +344,23 @@ class GUI(QWidget):
             rot=OPENGL_CONSTANTS.DEFAULT_ROTATION,
             scale=OPENGL_CONSTANTS.DEFAULT_SCALE,
             name=block_name,
+            pre_render=False,
         )
         self.add_block(block_name, model)
 
     def add_block(self, block_name: str, block: Cube or Model3D) -> None:
         """
-        Adds a block.
+        Adds a block. Its assets are loaded in the background and it is
+        drawn as a placeholder until they are ready.
         """
-        name_exists = any(obj._name == block_name for obj in self.ge._scene)
+        name_exists = block_name in self.ge.scene
         if block_name == "":
             self.name_empty()
         elif name_exists:
             self.name_exists()
         else:
-            self.ge._scene.insert(0, block)
-            self.update_dropdown()
+            self.ge.scene.add(block)
+            self.ge.asset_loader.load(block)
 
     def name_empty(self) -> None:
         """
@@ -1,34 +1,17 @@
-import cv2
-import numpy as np
+import logging
 
 from PyQt5.QtCore import Qt, QRectF
 from PyQt5.QtWidgets import QWidget, QSlider, QGridLayout, QLabel, QPushButton
 from PyQt5.QtGui import QPainter, QBrush, QColor, QPaintEvent
 from collections import defaultdict
 
+from src.animation import KeyFrameTimeline, update_objects
+from src.frame_reader import FrameReader
+from src.scene_io import save_scene
+from src.video_export import FrameEncoder
 from src.window.gui import GUI
 from src.constants import GUI_ANIMATION_WIDGET_CONSTANTS
 
-def calculate_new_vector_linear(
-        prev: tuple,
-        next: tuple,
-        cframe: int
-        ) -> tuple:
-    """
-    Calculates the new vector based on the previous and
-    next vector and the current frame.
-
-    :param prev: The previous vector.
-    :param next: The next vector.
-    :param cframe: The current frame.
-    """
-    pframe, (px, py, pz) = prev
-    nframe, (nx, ny, nz) = next
-    x = px + (nx - px) * ((cframe - pframe) / (nframe - pframe))
-    y = py + (ny - py) * ((cframe - pframe) / (nframe - pframe))
-    z = pz + (nz - pz) * ((cframe - pframe) / (nframe - pframe))
-    return x, y, z
-
 
 class MarkerSlider(QSlider):
     """
@@ -91,6 +74,7 @@ class GUIAnimation(QWidget):
         self.layout = QGridLayout(self)
         self.gui = gui
         self.key_frames = defaultdict(dict)
+        self._timeline = None
         self._init_slider()
         self._init_buttons()
         self.frame_label = QLabel(f"Frame: {self.slider.value()}")
@@ -130,6 +114,12 @@ class GUIAnimation(QWidget):
         self.renderButton.clicked.connect(self._on_render_button_clicked)
         self.layout.addWidget(self.renderButton, 0, 3, 1, 1)
 
+        self.saveSceneButton = QPushButton("Save scene")
+        self.saveSceneButton.clicked.connect(
+            self._on_save_scene_button_clicked
+        )
+        self.layout.addWidget(self.saveSceneButton, 1, 3, 1, 1)
+
     def _on_add_keyframe_button_clicked(self, _) -> None:
         """
         Adds a keyframe to the selected object.
@@ -140,91 +130,60 @@ class GUIAnimation(QWidget):
         frame = self.slider.value()
         self.slider.add_marker()
         obj = self.gui.selected_object
-        self.key_frames[obj._name][frame] = (obj._pos, obj._rot, obj._scale)
+        self.key_frames[obj._name][frame] = (obj.pos, obj.rot, obj.scale)
+        self._timeline = None
+
+    def _on_save_scene_button_clicked(self, _) -> None:
+        """
+        Saves the scene and its key frames for the headless renderer.
+        """
+        save_scene(
+            GUI_ANIMATION_WIDGET_CONSTANTS.SCENE_FILE_NAME,
+            self.gui.ge.scene,
+            self.key_frames,
+            (self.slider.minimum(), self.slider.maximum()),
+            self.gui.ge.camera,
+            self.gui.ge.light
+        )
 
     def _on_render_button_clicked(self, _) -> None:
         """
         Renders the animation.
         """
-        img = self.gui.ge.grabFrameBuffer()
-        img = img.convertToFormat(4)
-        width, height = img.width(), img.height()
-        result = cv2.VideoWriter(
-            f"{GUI_ANIMATION_WIDGET_CONSTANTS.OUTPUT_FILE_NAME}.avi",
-            cv2.VideoWriter_fourcc(*"MJPG"),
-            GUI_ANIMATION_WIDGET_CONSTANTS.OUTPUT_FPS,
-            (
-                width,
-                height
-            )
+        ge = self.gui.ge
+        ge.makeCurrent()
+        ge.asset_loader.wait()
+        fbo = ge.mgl_context.detect_framebuffer()
+        encoder = FrameEncoder(fbo.size)
+        reader = FrameReader(
+            ge.mgl_context, fbo, pool_size=encoder.queue_size + 2
         )
+        profiler = ge.profiler
         for i in range(self.slider.minimum(), self.slider.maximum() + 1):
-            self.update_objects(i)
-            self.gui.ge.update()
-            self.gui.ge.paintGL()
-            img = self.gui.ge.grabFrameBuffer()
-            img = img.convertToFormat(4)
-
-            ptr = img.bits()
-            ptr.setsize(img.byteCount())
-            img = np.array(ptr, np.uint8).reshape(height, width, 4)
-            img = img[:, :, 0:3]
-            result.write(img)
-        pass
-        result.release()
+            with profiler.phase("animate"):
+                self.update_objects(i)
+            ge.paintGL()
+            with profiler.phase("readback"):
+                img = reader.read()
+            if img is not None:
+                with profiler.phase("encode"):
+                    encoder.write(img)
+        for img in reader.flush():
+            encoder.write(img)
+        reader.release()
+        encoder.close()
+        ge.doneCurrent()
+        ge.request_render()
+        logging.info(encoder.report())
 
     def update_objects(self, frame: int) -> None:
         """
-        Updates the objects to the given frame.
+        Updates the objects to the given frame and redraws the view. The
+        timeline is rebuilt only after the key frames changed.
 
         :param frame: The frame to update to.
         """
-        for obj_name, keyframes in self.key_frames.items():
-            obj = next(
-                (o for o in self.gui.ge._scene if obj_name == o._name),
-                None
-            )
-            if obj is not None:
-                if frame in keyframes:
-                    pos, rot, scale = keyframes[frame]
-                    obj._pos = pos
-                    obj._rot = rot
-                    obj._scale = scale
-                elif len(keyframes) > 0:
-
-                    def get_greater(frames, current_frame):
-                        min = sorted((i for i in frames if i < current_frame))
-                        return min[-1] if len(min) > 0 else None
-
-                    def get_lower(frames, current_frame):
-                        min = sorted((i for i in frames if i > current_frame))
-                        return min[0] if len(min) > 0 else None
-
-                    greater = get_greater(keyframes.keys(), frame)
-                    lower = get_lower(keyframes.keys(), frame)
-
-                    if greater is not None and lower is not None:
-                        ppos, prot, pscale = keyframes[lower]
-                        npos, nrot, nscale = keyframes[greater]
-                        pos = calculate_new_vector_linear(
-                            (lower, ppos), (greater, npos), frame
-                        )
-                        rot = calculate_new_vector_linear(
-                            (lower, prot), (greater, nrot), frame
-                        )
-                        scale = calculate_new_vector_linear(
-                            (lower, pscale), (greater, nscale), frame
-                        )
-                        obj._pos = pos
-                        obj._rot = rot
-                        obj._scale = scale
-                    elif greater is not None:
-                        pos, rot, scale = keyframes[greater]
-                        obj._pos = pos
-                        obj._rot = rot
-                        obj._scale = scale
-                    elif lower is not None:
-                        pos, rot, scale = keyframes[lower]
-                        obj._pos = pos
-                        obj._rot = rot
-                        obj._scale = scale
+        if self._timeline is None:
+            self._timeline = KeyFrameTimeline(self.key_frames)
+        update_objects(self.gui.ge.scene, self._timeline, frame)
+        self.gui.ge.request_render()
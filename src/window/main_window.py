@@ -5,8 +5,7 @@ from PyQt5.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
-from PyQt5.QtCore import QTimer
-
+from src import startup_trace
 from src.graphics_engine import GraphicsEngine
 from src.window.gui import GUI
 from src.window.gui_animation import GUIAnimation
@@ -28,11 +27,14 @@ class MainWindow(QMainWindow):
 
         self._init_window()
         self._init_central_widget()
-        self._init_ge_widget()
-        self._init_gui_widget()
-        self._init_gui_animation_widget()
+        with startup_trace.span("graphics engine widget"):
+            self._init_ge_widget()
+        with startup_trace.span("gui widget"):
+            self._init_gui_widget()
+        with startup_trace.span("animation widget"):
+            self._init_gui_animation_widget()
 
-        self._init_timer()
+        self._init_render_sync()
 
     def _init_window(self) -> None:
         """
@@ -86,11 +88,9 @@ class MainWindow(QMainWindow):
         )
         self.layout.addWidget(self.gui_animation_widget)
 
-    def _init_timer(self) -> None:
+    def _init_render_sync(self) -> None:
         """
-        Initializes the timer.
+        Updates the GUI after every rendered frame. The graphics engine
+        renders on demand, so nothing runs while the scene is static.
         """
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.ge_widget.update)
-        self.timer.timeout.connect(self.gui_widget.update)
-        self.timer.start(GE_WIDGET_CONSTANTS.TIME_PER_TICK)
+        self.ge_widget.rendered.connect(self.gui_widget.update)
@@ -0,0 +1,29 @@
+"""
+Checks that the window shows its first frame within the cold-start budget,
+without importing the modules that are deferred until first use.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TIMEOUT_S = 60
+
+
+@pytest.mark.skipif(
+    sys.platform.startswith("linux")
+    and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")),
+    reason="the window needs a display with OpenGL"
+)
+def test_cold_start_budget():
+    result = subprocess.run(
+        [sys.executable, "run.py", "--startup-budget"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        timeout=TIMEOUT_S,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "first frame" in result.stdout